@@ -1,24 +1,198 @@
 import os
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response, send_from_directory, url_for
 from dotenv import load_dotenv
 import requests
 from datetime import datetime, timedelta
 import json
+import csv
+import queue
+import re
+import difflib
+import sqlite3
+import hashlib
+import gzip
+import mimetypes
+import threading
+import time
+import bisect
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, namedtuple
+from types import MappingProxyType
+import click
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from werkzeug.security import safe_join
+
+# Optional accelerators: orjson for JSON encoding, brotli for compression
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 load_dotenv()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson. Keys stay sorted and anything orjson
+    doesn't encode natively (datetimes included) goes through Flask's
+    default handling, so output matches the standard provider.
+    """
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson:
+    app.json = OrjsonProvider(app)
 
 ODDS_API_KEY = os.getenv('ODDS_API_KEY')
 ODDS_API_URL = 'https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds/'
+SCORES_API_URL = 'https://api.the-odds-api.com/v4/sports/americanfootball_nfl/scores/'
 
 NFL_2025_WEEK1_START = datetime(2025, 9, 4)  # Thursday, Sep 4, 2025
 NFL_WEEKS = 18
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///picks.db'
+# The league's own players, seeded alongside the NFL rosters
+LEAGUE_PLAYERS = ["Jaren", "JB", "Rory", "Zach"]
+
+# Full Odds API team names to the abbreviations used in pick values
+TEAM_ABBREVIATIONS = {
+    "Arizona Cardinals": "ARI",
+    "Atlanta Falcons": "ATL",
+    "Baltimore Ravens": "BAL",
+    "Buffalo Bills": "BUF",
+    "Carolina Panthers": "CAR",
+    "Chicago Bears": "CHI",
+    "Cincinnati Bengals": "CIN",
+    "Cleveland Browns": "CLE",
+    "Dallas Cowboys": "DAL",
+    "Denver Broncos": "DEN",
+    "Detroit Lions": "DET",
+    "Green Bay Packers": "GB",
+    "Houston Texans": "HOU",
+    "Indianapolis Colts": "IND",
+    "Jacksonville Jaguars": "JAX",
+    "Kansas City Chiefs": "KC",
+    "Las Vegas Raiders": "LV",
+    "Los Angeles Chargers": "LAC",
+    "Los Angeles Rams": "LAR",
+    "Miami Dolphins": "MIA",
+    "Minnesota Vikings": "MIN",
+    "New England Patriots": "NE",
+    "New Orleans Saints": "NO",
+    "New York Giants": "NYG",
+    "New York Jets": "NYJ",
+    "Philadelphia Eagles": "PHI",
+    "Pittsburgh Steelers": "PIT",
+    "San Francisco 49ers": "SF",
+    "Seattle Seahawks": "SEA",
+    "Tampa Bay Buccaneers": "TB",
+    "Tennessee Titans": "TEN",
+    "Washington Commanders": "WAS"
+}
+
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///picks.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Connection pool per worker process. SQLite connections also wait up to
+# SQLITE_BUSY_TIMEOUT_MS for a competing writer instead of failing with
+# "database is locked".
+app.config['SQLITE_BUSY_TIMEOUT_MS'] = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+    'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+    'connect_args': {'timeout': app.config['SQLITE_BUSY_TIMEOUT_MS'] / 1000}
+}
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer; NORMAL sync is durable under WAL except for the last commits on
+# power loss. Cache size is in KiB.
+app.config['SQLITE_JOURNAL_MODE'] = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+app.config['SQLITE_SYNCHRONOUS'] = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+app.config['SQLITE_CACHE_SIZE_KB'] = int(os.getenv('SQLITE_CACHE_SIZE_KB', 20000))
+
+# Odds refresh TTLs as (kickoff within, refresh every) tiers: the closer a
+# game is to kickoff, the more often its lines are re-pulled. Games further
+# out than the last tier use ODDS_TTL_MAX; started games are never refreshed.
+app.config['ODDS_TTL_TIERS'] = [
+    (timedelta(hours=3), timedelta(minutes=15)),
+    (timedelta(hours=24), timedelta(hours=1)),
+    (timedelta(days=3), timedelta(hours=4)),
+]
+app.config['ODDS_TTL_MAX'] = timedelta(hours=int(os.getenv('ODDS_TTL_MAX_HOURS', 12)))
+# After a failed odds fetch for a week (or a first fetch that found no games),
+# wait this long before asking again, doubling per consecutive failure up to
+# ODDS_TTL_MAX, so an exhausted quota isn't hit on every page load
+app.config['ODDS_RETRY_MIN'] = timedelta(minutes=int(os.getenv('ODDS_RETRY_MINUTES', 5)))
+
+# Where final scores come from: 'odds-api' (needs ODDS_API_KEY) or 'file',
+# which reads SCORES_FILE ({"2025-1": {"Away @ Home": {...}}}) for offline use
+app.config['SCORE_PROVIDER'] = os.getenv('SCORE_PROVIDER', 'odds-api' if ODDS_API_KEY else 'file')
+app.config['SCORES_FILE'] = os.getenv('SCORES_FILE', os.path.join(app.root_path, 'scores.json'))
+# Provider for per-game touchdown scorers; The Odds API has none, so this
+# defaults to the file provider's "touchdowns" lists
+app.config['TOUCHDOWN_PROVIDER'] = os.getenv('TOUCHDOWN_PROVIDER', 'file')
+
+# NFL rosters ({"KC": [{"name": ..., "pos": ...}]}) loaded by `flask seed`
+app.config['ROSTER_FILE'] = os.getenv('ROSTER_FILE', os.path.join(app.root_path, 'starters.json'))
+
+# How often the roster index checks whether `flask seed` loaded new rosters, in seconds
+app.config['ROSTER_RELOAD_INTERVAL'] = int(os.getenv('ROSTER_RELOAD_INTERVAL', 2))
+
+# Seconds between score polls while any client is streaming live updates
+app.config['LIVE_POLL_INTERVAL'] = int(os.getenv('LIVE_POLL_INTERVAL', 30))
+
+# Each /api/live stream holds a server thread for as long as the page is open,
+# so a process serves at most LIVE_MAX_STREAMS of them; other clients poll
+# /api/live/<week> instead. Games count as in progress from kickoff until
+# final, or for at most LIVE_GAME_HOURS if no final score arrives.
+app.config['LIVE_MAX_STREAMS'] = int(os.getenv('LIVE_MAX_STREAMS', 2))
+app.config['LIVE_GAME_HOURS'] = int(os.getenv('LIVE_GAME_HOURS', 5))
+
+# Seconds a worker trusts its cached week locks and kickoff times before
+# reloading them, so a lock taken in another worker applies within this time
+app.config['LOCK_MAP_TTL'] = int(os.getenv('LOCK_MAP_TTL', 5))
+
+# Bookmaker whose spreads are recorded on Favorite/Underdog picks
+app.config['PICK_LINE_BOOKMAKER'] = 'fanduel'
+
+# Leaderboard scoring per outcome and the rolling form windows (in weeks)
+# reported as lastN_points / lastN_record
+app.config['LEADERBOARD_SCORE_MAP'] = {'win': 3, 'tie': 1, 'loss': 0}
+app.config['LEADERBOARD_FORM_WINDOWS'] = (3, 5)
+
+# Opt-in gzip/brotli compression of text responses of at least
+# COMPRESS_MIN_SIZE bytes, negotiated per request from Accept-Encoding
+app.config['COMPRESS_RESPONSES'] = os.getenv('COMPRESS_RESPONSES', '0') == '1'
+app.config['COMPRESS_MIN_SIZE'] = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+app.config['COMPRESS_MIMETYPES'] = {'application/json', 'text/html', 'text/css', 'text/javascript', 'text/plain'}
+
+# Browser cache lifetime for /api/games; afterwards clients revalidate by ETag
+app.config['GAMES_CACHE_MAX_AGE'] = int(os.getenv('GAMES_CACHE_MAX_AGE', 60))
+
+@event.listens_for(Engine, 'connect')
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode = {app.config['SQLITE_JOURNAL_MODE']}")
+    cursor.execute(f"PRAGMA synchronous = {app.config['SQLITE_SYNCHRONOUS']}")
+    cursor.execute(f"PRAGMA busy_timeout = {app.config['SQLITE_BUSY_TIMEOUT_MS']}")
+    cursor.execute(f"PRAGMA cache_size = -{app.config['SQLITE_CACHE_SIZE_KB']}")
+    cursor.execute('PRAGMA temp_store = MEMORY')
+    cursor.close()
+
 db = SQLAlchemy(app)
 
 class Player(db.Model):
@@ -34,8 +208,17 @@ class Game(db.Model):
     home_team = db.Column(db.String(64), nullable=False)
     away_team = db.Column(db.String(64), nullable=False)
     commence_time = db.Column(db.String(32), nullable=False)
-    odds_data = db.Column(db.Text, nullable=True)  # Store full odds as JSON
+    odds_data = db.Column(db.Text, nullable=True)  # Legacy full odds JSON, superseded by OddsLine
+    odds_updated_at = db.Column(db.DateTime, nullable=True)
     picks = db.relationship('Pick', backref='game', lazy=True)
+    odds_lines = db.relationship('OddsLine', backref='game', lazy=True, cascade='all, delete-orphan')
+    
+    # One row per scheduled game; odds ingestion upserts against this key.
+    # Declared as an Index (not a UniqueConstraint) so a migration can add it
+    # to an existing game table.
+    __table_args__ = (
+        db.Index('uq_game_slot', 'season', 'week', 'home_team', 'away_team', 'commence_time', unique=True),
+    )
 
 class Pick(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -45,6 +228,7 @@ class Pick(db.Model):
     category = db.Column(db.String(32), nullable=False)
     value = db.Column(db.String(128), nullable=False)
     game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=True)
+    line = db.Column(db.Float, nullable=True)  # Spread or total at the time of the pick
     
     # Ensure unique pick per player/week/category
     __table_args__ = (db.UniqueConstraint('week', 'season', 'player_id', 'category'),)
@@ -57,6 +241,73 @@ class Result(db.Model):
     category = db.Column(db.String(32), nullable=False)
     outcome = db.Column(db.String(16), nullable=False)  # win/loss/tie
     pick_id = db.Column(db.Integer, db.ForeignKey('pick.id'), nullable=True)
+    
+    __table_args__ = (
+        # One result per player/week/category, also the week lookup index
+        db.Index('uq_result_slot', 'week', 'season', 'player_id', 'category', unique=True),
+        # Covers the leaderboard's per-player outcome counts
+        db.Index('ix_result_season_player_outcome', 'season', 'player_id', 'outcome'),
+    )
+
+class Standing(db.Model):
+    # Materialized weekly record per player, rewritten from Result in the
+    # same transaction whenever that player's results for the week change
+    id = db.Column(db.Integer, primary_key=True)
+    season = db.Column(db.Integer, nullable=False)
+    week = db.Column(db.Integer, nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    ties = db.Column(db.Integer, nullable=False, default=0)
+    total_picks = db.Column(db.Integer, nullable=False, default=0)
+    
+    __table_args__ = (db.UniqueConstraint('season', 'week', 'player_id'),)
+
+class GameResult(db.Model):
+    # Scores reported by the score provider; rows marked final are never refetched
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False, unique=True)
+    home_score = db.Column(db.Integer, nullable=True)
+    away_score = db.Column(db.Integer, nullable=True)
+    final = db.Column(db.Boolean, nullable=False, default=False)
+    updated_at = db.Column(db.DateTime, nullable=False)
+    touchdowns_loaded = db.Column(db.Boolean, nullable=True, default=False)
+
+class TouchdownScorer(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
+    name = db.Column(db.String(128), nullable=False)
+    team = db.Column(db.String(8), nullable=False)  # Team abbreviation
+    
+    # A player is listed once per game however many times they scored
+    __table_args__ = (db.UniqueConstraint('game_id', 'name'),)
+
+class OddsLine(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
+    bookmaker = db.Column(db.String(32), nullable=False)  # Odds API key, e.g. fanduel
+    market = db.Column(db.String(16), nullable=False)     # h2h, spreads or totals
+    outcome = db.Column(db.String(64), nullable=False)    # Team name, Over or Under
+    price = db.Column(db.Integer, nullable=False)         # American odds
+    point = db.Column(db.Float, nullable=True)            # Spread or total line
+    fetched_at = db.Column(db.DateTime, nullable=False)
+    
+    # One current line per outcome; also serves game/bookmaker/market lookups
+    __table_args__ = (db.UniqueConstraint('game_id', 'bookmaker', 'market', 'outcome'),)
+
+class OddsSnapshot(db.Model):
+    # Append-only line history: a row is written only when an outcome's
+    # price or point differs from the previously stored line
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
+    bookmaker = db.Column(db.String(32), nullable=False)
+    market = db.Column(db.String(16), nullable=False)
+    outcome = db.Column(db.String(64), nullable=False)
+    price = db.Column(db.Integer, nullable=False)
+    point = db.Column(db.Float, nullable=True)
+    recorded_at = db.Column(db.DateTime, nullable=False)
+    
+    __table_args__ = (db.Index('ix_odds_snapshot_game_time', 'game_id', 'recorded_at'),)
 
 # Add this new model after the existing models
 class NFLPlayer(db.Model):
@@ -64,10 +315,14 @@ class NFLPlayer(db.Model):
     name = db.Column(db.String(128), nullable=False)
     position = db.Column(db.String(8), nullable=False)  # QB, RB, WR, TE, etc.
     team = db.Column(db.String(8), nullable=False)      # Team abbreviation
-    active = db.Column(db.Boolean, default=True)
+    active = db.Column(db.Boolean, default=True)        # Still listed in ROSTER_FILE
+    depth = db.Column(db.Integer, nullable=True)        # 1 for the team's first player at the position
     
     # Ensure unique player per team
-    __table_args__ = (db.UniqueConstraint('name', 'team'),)
+    __table_args__ = (
+        db.UniqueConstraint('name', 'team'),
+        db.Index('ix_nfl_player_team_active', 'team', 'active'),
+    )
 
 # Add this new model after the existing models
 class WeekLock(db.Model):
@@ -80,262 +335,1035 @@ class WeekLock(db.Model):
     # Ensure only one lock per week/season
     __table_args__ = (db.UniqueConstraint('week', 'season'),)
 
-# Create tables if not exist
-with app.app_context():
+class DataVersion(db.Model):
+    # Checksum of each seeded data set, so startup can skip re-seeding
+    name = db.Column(db.String(32), primary_key=True)
+    checksum = db.Column(db.String(64), nullable=False)
+    loaded_at = db.Column(db.DateTime, nullable=False)
+
+def odds_line_rows(game_id, bookmakers, fetched_at):
+    """Flatten an Odds API bookmakers array into OddsLine rows."""
+    return [{
+        'game_id': game_id,
+        'bookmaker': bookmaker['key'],
+        'market': market['key'],
+        'outcome': outcome['name'],
+        'price': outcome['price'],
+        'point': outcome.get('point'),
+        'fetched_at': fetched_at
+    } for bookmaker in bookmakers
+      for market in bookmaker.get('markets', [])
+      for outcome in market.get('outcomes', [])]
+
+def store_odds_lines(bookmakers_by_game, fetched_at):
+    """
+    Replace the stored lines for each game id with its latest bookmakers
+    array, appending any changed lines to the OddsSnapshot history.
+    """
+    if not bookmakers_by_game:
+        return
+    
+    current = OddsLine.query.filter(OddsLine.game_id.in_(bookmakers_by_game))
+    previous = {
+        (line.game_id, line.bookmaker, line.market, line.outcome): (line.price, line.point)
+        for line in current
+    }
+    current.delete(synchronize_session=False)
+    
+    rows = [row for game_id, bookmakers in bookmakers_by_game.items()
+            for row in odds_line_rows(game_id, bookmakers, fetched_at)]
+    if not rows:
+        return
+    db.session.execute(db.insert(OddsLine), rows)
+    
+    changed = [{
+        'game_id': row['game_id'],
+        'bookmaker': row['bookmaker'],
+        'market': row['market'],
+        'outcome': row['outcome'],
+        'price': row['price'],
+        'point': row['point'],
+        'recorded_at': fetched_at
+    } for row in rows
+      if previous.get((row['game_id'], row['bookmaker'], row['market'], row['outcome'])) != (row['price'], row['point'])]
+    if changed:
+        db.session.execute(db.insert(OddsSnapshot), changed)
+
+def backfill_odds_lines():
+    """Normalize odds_data blobs of games stored before OddsLine existed."""
+    games = Game.query.filter(Game.odds_data.isnot(None), ~Game.odds_lines.any()).all()
+    for game in games:
+        odds = json.loads(game.odds_data)
+        # Early rows stored the whole Odds API event rather than its bookmakers
+        bookmakers = odds.get('bookmakers', []) if isinstance(odds, dict) else odds
+        store_odds_lines({game.id: bookmakers}, game.odds_updated_at or datetime.utcnow())
+
+def refresh_standings(season, week=None, player_ids=None):
+    """
+    Recompute Standing rows from Result for a season, optionally limited to
+    one week and some players. Call before committing the Result writes so
+    both land in the same transaction.
+    """
+    db.session.flush()
+    
+    query = db.select(
+        Result.season,
+        Result.week,
+        Result.player_id,
+        db.func.sum(db.case((Result.outcome == 'win', 1), else_=0)),
+        db.func.sum(db.case((Result.outcome == 'loss', 1), else_=0)),
+        db.func.sum(db.case((Result.outcome == 'tie', 1), else_=0)),
+        db.func.count(Result.id)
+    ).where(Result.season == season)
+    if week is not None:
+        query = query.where(Result.week == int(week))
+    if player_ids is not None:
+        query = query.where(Result.player_id.in_(player_ids))
+    query = query.group_by(Result.season, Result.week, Result.player_id)
+    
+    stmt = sqlite_insert(Standing).from_select(
+        ['season', 'week', 'player_id', 'wins', 'losses', 'ties', 'total_picks'], query
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['season', 'week', 'player_id'],
+        set_={
+            'wins': stmt.excluded.wins,
+            'losses': stmt.excluded.losses,
+            'ties': stmt.excluded.ties,
+            'total_picks': stmt.excluded.total_picks
+        }
+    )
+    db.session.execute(stmt)
+
+# "Over 46.5 (Dallas Cowboys @ Philadelphia Eagles)" or legacy "Over 45.5 (KC/LAC)"
+TOTAL_PICK_PATTERN = re.compile(r'^(Over|Under) (-?[\d.]+) \((.+)\)$')
+# "Rashee Rice (KC)"
+PLAYER_PICK_PATTERN = re.compile(r'^(.+) \(([A-Z]{2,3})\)$')
+
+def game_teams(game):
+    """Names and abbreviations of both teams in a game."""
+    return {
+        game.home_team, game.away_team,
+        TEAM_ABBREVIATIONS.get(game.home_team), TEAM_ABBREVIATIONS.get(game.away_team)
+    }
+
+def resolve_pick(category, value, games):
+    """
+    Find the game a pick is about among its week's games and the line it
+    was taken at. Returns (game, line); either may be None.
+    """
+    if category in ('Over', 'Under'):
+        match = TOTAL_PICK_PATTERN.match(value)
+        if not match:
+            return None, None
+        matchup = match.group(3)
+        teams = set(matchup.split(' @ ') if ' @ ' in matchup else matchup.split('/'))
+        game = next((g for g in games if teams <= game_teams(g)), None)
+        return game, float(match.group(2))
+    
+    if category == 'Touchdown Scorer':
+        match = PLAYER_PICK_PATTERN.match(value)
+        if not match:
+            return None, None
+        return next((g for g in games if match.group(2) in game_teams(g)), None), None
+    
+    # Moneyline, Favorite and Underdog picks are a team name
+    game = next((g for g in games if value in (g.home_team, g.away_team)), None)
+    if not game or category not in ('Favorite', 'Underdog'):
+        return game, None
+    spread = OddsLine.query.filter_by(
+        game_id=game.id,
+        bookmaker=app.config['PICK_LINE_BOOKMAKER'],
+        market='spreads',
+        outcome=value
+    ).first()
+    return game, spread.point if spread else None
+
+def link_picks(picks):
+    """Set game_id and line on each pick from its week's games."""
+    games_by_week = {}
+    for pick in picks:
+        key = (pick.season, int(pick.week))
+        if key not in games_by_week:
+            games_by_week[key] = Game.query.filter_by(week=key[1], season=key[0]).all()
+        game, pick.line = resolve_pick(pick.category, pick.value, games_by_week[key])
+        pick.game_id = game.id if game else None
+
+# Schema migrations for existing databases, applied in version order and
+# tracked in SQLite's user_version. create_all() only creates missing
+# tables, so anything that changes an existing table belongs here. Each
+# migration must be safe to re-run.
+MIGRATIONS = []
+
+def migration(version, description):
+    def register(fn):
+        MIGRATIONS.append((version, description, fn))
+        return fn
+    return register
+
+def add_column(column):
+    """Add a nullable model column to its existing table if it is missing."""
+    existing = {c['name'] for c in inspect(db.session.connection()).get_columns(column.table.name)}
+    if column.name not in existing:
+        column_type = column.type.compile(dialect=db.engine.dialect)
+        db.session.execute(db.text(f'ALTER TABLE {column.table.name} ADD COLUMN {column.name} {column_type}'))
+
+def create_indexes(model):
+    for index in model.__table__.indexes:
+        index.create(db.session.connection(), checkfirst=True)
+
+@migration(1, 'Add game.odds_updated_at')
+def migrate_game_odds_updated_at():
+    add_column(Game.__table__.c.odds_updated_at)
+
+@migration(2, 'De-duplicate games and add the uq_game_slot key')
+def migrate_game_slot_key():
+    db.session.execute(db.text("""
+        DELETE FROM game WHERE id NOT IN (
+            SELECT MIN(id) FROM game
+            GROUP BY season, week, home_team, away_team, commence_time
+        )
+    """))
+    create_indexes(Game)
+
+@migration(3, 'Normalize legacy odds_data blobs into odds_line rows')
+def migrate_odds_lines():
+    backfill_odds_lines()
+
+@migration(4, 'Add result/nfl_player indexes for the week, season and team filters')
+def migrate_hot_filter_indexes():
+    # Keep the most recently written result if a slot was ever duplicated
+    db.session.execute(db.text("""
+        DELETE FROM result WHERE id NOT IN (
+            SELECT MAX(id) FROM result
+            GROUP BY week, season, player_id, category
+        )
+    """))
+    create_indexes(Result)
+    create_indexes(NFLPlayer)
+
+@migration(5, 'Build standing rows from existing results')
+def migrate_standings():
+    for (season,) in db.session.query(Result.season).distinct():
+        refresh_standings(season)
+
+@migration(6, 'Add pick.line and link existing picks to their games')
+def migrate_pick_links():
+    add_column(Pick.__table__.c.line)
+    link_picks(Pick.query.filter(Pick.game_id.is_(None)).all())
+
+@migration(7, 'Add game_result.touchdowns_loaded')
+def migrate_touchdowns_loaded():
+    add_column(GameResult.__table__.c.touchdowns_loaded)
+
+@migration(8, 'Add nfl_player.depth')
+def migrate_nfl_player_depth():
+    add_column(NFLPlayer.__table__.c.depth)
+    # Make the next seed fill in depth even if the roster file is unchanged
+    db.session.execute(db.delete(DataVersion).where(DataVersion.name == 'rosters'))
+
+def schema_version():
+    return db.session.execute(db.text('PRAGMA user_version')).scalar()
+
+def upgrade_database():
+    """
+    Create missing tables and apply pending migrations, returning the
+    (version, description) of each migration applied. A brand-new database
+    gets the current schema from create_all() and starts at the latest version.
+    """
+    fresh = not inspect(db.engine).get_table_names()
     db.create_all()
+    latest = max(version for version, _, _ in MIGRATIONS)
     
-    # Add sample players if they don't exist
-    sample_players = ["Jaren", "JB", "Rory", "Zach"]
-    for player_name in sample_players:
-        if not Player.query.filter_by(name=player_name).first():
-            player = Player(name=player_name)
-            db.session.add(player)
+    if fresh:
+        db.session.execute(db.text(f'PRAGMA user_version = {latest}'))
+        db.session.commit()
+        return []
     
-    # Add sample NFL players if they don't exist
-    sample_nfl_players = [
-        # Quarterbacks
-        {"name": "Patrick Mahomes", "position": "QB", "team": "KC"},
-        {"name": "Josh Allen", "position": "QB", "team": "BUF"},
-        {"name": "Lamar Jackson", "position": "QB", "team": "BAL"},
-        {"name": "Jalen Hurts", "position": "QB", "team": "PHI"},
-        {"name": "Dak Prescott", "position": "QB", "team": "DAL"},
-        {"name": "Tua Tagovailoa", "position": "QB", "team": "MIA"},
-        {"name": "Joe Burrow", "position": "QB", "team": "CIN"},
-        {"name": "Justin Herbert", "position": "QB", "team": "LAC"},
-        {"name": "Trevor Lawrence", "position": "QB", "team": "JAX"},
-        {"name": "Deshaun Watson", "position": "QB", "team": "CLE"},
-        {"name": "Kenny Pickett", "position": "QB", "team": "PIT"},
-        {"name": "C.J. Stroud", "position": "QB", "team": "HOU"},
-        {"name": "Anthony Richardson", "position": "QB", "team": "IND"},
-        {"name": "Will Levis", "position": "QB", "team": "TEN"},
-        {"name": "Russell Wilson", "position": "QB", "team": "DEN"},
-        {"name": "Jimmy Garoppolo", "position": "QB", "team": "LV"},
-        {"name": "Matthew Stafford", "position": "QB", "team": "LAR"},
-        {"name": "Brock Purdy", "position": "QB", "team": "SF"},
-        {"name": "Geno Smith", "position": "QB", "team": "SEA"},
-        {"name": "Kyler Murray", "position": "QB", "team": "ARI"},
-        {"name": "Jared Goff", "position": "QB", "team": "DET"},
-        {"name": "Jordan Love", "position": "QB", "team": "GB"},
-        {"name": "Kirk Cousins", "position": "QB", "team": "MIN"},
-        {"name": "Justin Fields", "position": "QB", "team": "CHI"},
-        {"name": "Derek Carr", "position": "QB", "team": "NO"},
-        {"name": "Baker Mayfield", "position": "QB", "team": "TB"},
-        {"name": "Desmond Ridder", "position": "QB", "team": "ATL"},
-        {"name": "Bryce Young", "position": "QB", "team": "CAR"},
-        {"name": "Daniel Jones", "position": "QB", "team": "NYG"},
-        {"name": "Sam Howell", "position": "QB", "team": "WAS"},
-        {"name": "Aaron Rodgers", "position": "QB", "team": "NYJ"},
-        {"name": "Mac Jones", "position": "QB", "team": "NE"},
-        
-        # Running Backs
-        {"name": "Christian McCaffrey", "position": "RB", "team": "SF"},
-        {"name": "Saquon Barkley", "position": "RB", "team": "PHI"},
-        {"name": "Austin Ekeler", "position": "RB", "team": "LAC"},
-        {"name": "Derrick Henry", "position": "RB", "team": "BAL"},
-        {"name": "Nick Chubb", "position": "RB", "team": "CLE"},
-        {"name": "Alvin Kamara", "position": "RB", "team": "NO"},
-        {"name": "Josh Jacobs", "position": "RB", "team": "GB"},
-        {"name": "Tony Pollard", "position": "RB", "team": "TEN"},
-        {"name": "Rachaad White", "position": "RB", "team": "TB"},
-        {"name": "Breece Hall", "position": "RB", "team": "NYJ"},
-        {"name": "Travis Etienne", "position": "RB", "team": "JAX"},
-        {"name": "James Cook", "position": "RB", "team": "BUF"},
-        {"name": "Najee Harris", "position": "RB", "team": "PIT"},
-        {"name": "Dameon Pierce", "position": "RB", "team": "HOU"},
-        {"name": "Jonathan Taylor", "position": "RB", "team": "IND"},
-        {"name": "Javonte Williams", "position": "RB", "team": "DEN"},
-        {"name": "Josh Jacobs", "position": "RB", "team": "LV"},
-        {"name": "Kyren Williams", "position": "RB", "team": "LAR"},
-        {"name": "Kenneth Walker", "position": "RB", "team": "SEA"},
-        {"name": "James Conner", "position": "RB", "team": "ARI"},
-        {"name": "David Montgomery", "position": "RB", "team": "DET"},
-        {"name": "Aaron Jones", "position": "RB", "team": "GB"},
-        {"name": "Alexander Mattison", "position": "RB", "team": "MIN"},
-        {"name": "Khalil Herbert", "position": "RB", "team": "CHI"},
-        {"name": "Jamaal Williams", "position": "RB", "team": "NO"},
-        {"name": "Rachaad White", "position": "RB", "team": "TB"},
-        {"name": "Tyler Allgeier", "position": "RB", "team": "ATL"},
-        {"name": "Miles Sanders", "position": "RB", "team": "CAR"},
-        {"name": "Saquon Barkley", "position": "RB", "team": "NYG"},
-        {"name": "Brian Robinson", "position": "RB", "team": "WAS"},
-        
-        # Wide Receivers
-        {"name": "Tyreek Hill", "position": "WR", "team": "MIA"},
-        {"name": "Justin Jefferson", "position": "WR", "team": "MIN"},
-        {"name": "Ja'Marr Chase", "position": "WR", "team": "CIN"},
-        {"name": "CeeDee Lamb", "position": "WR", "team": "DAL"},
-        {"name": "A.J. Brown", "position": "WR", "team": "PHI"},
-        {"name": "Stefon Diggs", "position": "WR", "team": "HOU"},
-        {"name": "Davante Adams", "position": "WR", "team": "LV"},
-        {"name": "Cooper Kupp", "position": "WR", "team": "LAR"},
-        {"name": "Deebo Samuel", "position": "WR", "team": "SF"},
-        {"name": "DK Metcalf", "position": "WR", "team": "SEA"},
-        {"name": "Marquise Brown", "position": "WR", "team": "ARI"},
-        {"name": "Amon-Ra St. Brown", "position": "WR", "team": "DET"},
-        {"name": "Christian Watson", "position": "WR", "team": "GB"},
-        {"name": "D.J. Moore", "position": "WR", "team": "CHI"},
-        {"name": "Chris Olave", "position": "WR", "team": "NO"},
-        {"name": "Mike Evans", "position": "WR", "team": "TB"},
-        {"name": "Drake London", "position": "WR", "team": "ATL"},
-        {"name": "Adam Thielen", "position": "WR", "team": "CAR"},
-        {"name": "Darius Slayton", "position": "WR", "team": "NYG"},
-        {"name": "Terry McLaurin", "position": "WR", "team": "WAS"},
-        {"name": "Garrett Wilson", "position": "WR", "team": "NYJ"},
-        {"name": "DeVante Parker", "position": "WR", "team": "NE"},
-        {"name": "Rashee Rice", "position": "WR", "team": "KC"},
-        {"name": "Gabe Davis", "position": "WR", "team": "BUF"},
-        {"name": "Zay Flowers", "position": "WR", "team": "BAL"},
-        {"name": "DeVonta Smith", "position": "WR", "team": "PHI"},
-        {"name": "Jaylen Waddle", "position": "WR", "team": "MIA"},
-        {"name": "Tee Higgins", "position": "WR", "team": "CIN"},
-        {"name": "Amari Cooper", "position": "WR", "team": "CLE"},
-        {"name": "George Pickens", "position": "WR", "team": "PIT"},
-        {"name": "Nico Collins", "position": "WR", "team": "HOU"},
-        {"name": "Michael Pittman", "position": "WR", "team": "IND"},
-        {"name": "Calvin Ridley", "position": "WR", "team": "JAX"},
-        {"name": "DeAndre Hopkins", "position": "WR", "team": "TEN"},
-        {"name": "Courtland Sutton", "position": "WR", "team": "DEN"},
-        {"name": "Jakobi Meyers", "position": "WR", "team": "LV"},
-        {"name": "Keenan Allen", "position": "WR", "team": "LAC"},
-        {"name": "Puka Nacua", "position": "WR", "team": "LAR"},
-        {"name": "Brandon Aiyuk", "position": "WR", "team": "SF"},
-        {"name": "Tyler Lockett", "position": "WR", "team": "SEA"},
-        
-        # Tight Ends
-        {"name": "Travis Kelce", "position": "TE", "team": "KC"},
-        {"name": "Mark Andrews", "position": "TE", "team": "BAL"},
-        {"name": "Dawson Knox", "position": "TE", "team": "BUF"},
-        {"name": "Dallas Goedert", "position": "TE", "team": "PHI"},
-        {"name": "Durham Smythe", "position": "TE", "team": "MIA"},
-        {"name": "Hunter Henry", "position": "TE", "team": "NE"},
-        {"name": "Irv Smith", "position": "TE", "team": "CIN"},
-        {"name": "David Njoku", "position": "TE", "team": "CLE"},
-        {"name": "Pat Freiermuth", "position": "TE", "team": "PIT"},
-        {"name": "Dalton Schultz", "position": "TE", "team": "HOU"},
-        {"name": "Jelani Woods", "position": "TE", "team": "IND"},
-        {"name": "Evan Engram", "position": "TE", "team": "JAX"},
-        {"name": "Chigoziem Okonkwo", "position": "TE", "team": "TEN"},
-        {"name": "Greg Dulcich", "position": "TE", "team": "DEN"},
-        {"name": "Michael Mayer", "position": "TE", "team": "LV"},
-        {"name": "Gerald Everett", "position": "TE", "team": "LAC"},
-        {"name": "Tyler Higbee", "position": "TE", "team": "LAR"},
-        {"name": "George Kittle", "position": "TE", "team": "SF"},
-        {"name": "Noah Fant", "position": "TE", "team": "SEA"},
-        {"name": "Trey McBride", "position": "TE", "team": "ARI"},
-        {"name": "Sam LaPorta", "position": "TE", "team": "DET"},
-        {"name": "Luke Musgrave", "position": "TE", "team": "GB"},
-        {"name": "T.J. Hockenson", "position": "TE", "team": "MIN"},
-        {"name": "Cole Kmet", "position": "TE", "team": "CHI"},
-        {"name": "Juwan Johnson", "position": "TE", "team": "NO"},
-        {"name": "Cade Otton", "position": "TE", "team": "TB"},
-        {"name": "Kyle Pitts", "position": "TE", "team": "ATL"},
-        {"name": "Hayden Hurst", "position": "TE", "team": "CAR"},
-        {"name": "Darren Waller", "position": "TE", "team": "NYG"},
-        {"name": "Logan Thomas", "position": "TE", "team": "WAS"},
-        {"name": "Tyler Conklin", "position": "TE", "team": "NYJ"}
-    ]
+    applied = []
+    current = schema_version()
+    for version, description, fn in sorted(MIGRATIONS):
+        if version <= current:
+            continue
+        try:
+            fn()
+            db.session.execute(db.text(f'PRAGMA user_version = {version}'))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        applied.append((version, description))
+    return applied
+
+@app.cli.command('db-upgrade')
+def db_upgrade_command():
+    """Apply pending schema migrations."""
+    applied = upgrade_database()
+    for version, description in applied:
+        click.echo(f"Applied migration {version}: {description}")
+    click.echo(f"Database is at schema version {schema_version()}")
+
+def seed_rosters(force=False):
+    """
+    Load LEAGUE_PLAYERS with one insert-or-ignore and sync NFLPlayer to the
+    rosters in ROSTER_FILE with one upsert: listed players are active with
+    their file position and depth, anyone no longer listed is marked
+    inactive. A player listed twice for a team is loaded once; one listed
+    for several teams is kept under each and logged as a warning. Skipped
+    when the data matches the checksum recorded by the last seed, unless
+    force is set. Returns the number of NFL players loaded, or None if
+    seeding was skipped.
+    """
+    with open(app.config['ROSTER_FILE'], 'rb') as f:
+        content = f.read()
+    checksum = hashlib.sha256(content + json.dumps(LEAGUE_PLAYERS).encode()).hexdigest()
+    marker = db.session.get(DataVersion, 'rosters')
+    if marker and marker.checksum == checksum and not force:
+        return None
     
-    for player_data in sample_nfl_players:
-        if not NFLPlayer.query.filter_by(name=player_data["name"], team=player_data["team"]).first():
-            player = NFLPlayer(**player_data)
-            db.session.add(player)
+    db.session.execute(
+        sqlite_insert(Player).values([{'name': name} for name in LEAGUE_PLAYERS]).on_conflict_do_nothing()
+    )
     
+    rows = []
+    teams_by_player = {}
+    for team, players in json.loads(content).items():
+        depth = Counter()
+        listed = set()
+        for player in players:
+            if player['name'] in listed:
+                continue
+            listed.add(player['name'])
+            depth[player['pos']] += 1
+            rows.append({
+                'name': player['name'],
+                'position': player['pos'],
+                'team': team,
+                'depth': depth[player['pos']],
+                'active': True
+            })
+            teams_by_player.setdefault(normalize_player_name(player['name']), (player['name'], []))[1].append(team)
+    for name, teams in teams_by_player.values():
+        if len(teams) > 1:
+            app.logger.warning("Roster: %s is listed for %s", name, ', '.join(teams))
+    
+    db.session.execute(db.update(NFLPlayer).values(active=False))
+    if rows:
+        stmt = sqlite_insert(NFLPlayer).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['name', 'team'],
+            set_={'position': stmt.excluded.position, 'depth': stmt.excluded.depth, 'active': True}
+        )
+        db.session.execute(stmt)
+    db.session.merge(DataVersion(name='rosters', checksum=checksum, loaded_at=datetime.utcnow()))
     db.session.commit()
+    return len(rows)
+
+@app.cli.command('seed')
+@click.option('--force', is_flag=True, help='Reload even if the roster data is unchanged.')
+def seed_command(force):
+    """Load league players and NFL rosters from ROSTER_FILE."""
+    loaded = seed_rosters(force)
+    if loaded is None:
+        click.echo("Rosters are current")
+    else:
+        click.echo(f"Loaded {loaded} NFL players")
+
+def init_database():
+    """
+    Apply pending migrations and seed rosters. Run once per deployment, not
+    per worker: gunicorn.conf.py calls it from the master before forking.
+    """
+    upgrade_database()
+    seed_rosters()
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+# Built assets: `flask build-assets` minifies and fingerprints static .js/.css
+# into static/dist with gzip (and, if the brotli package is installed,
+# brotli) variants. Templates link them through asset_url().
+ASSET_BUILD_DIR = os.path.join(app.static_folder, 'dist')
+ASSET_MANIFEST = os.path.join(ASSET_BUILD_DIR, 'manifest.json')
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+def minify_js(source):
+    """
+    Drop full-line // comments, indentation and blank lines. Line breaks are
+    kept, so automatic semicolon insertion behaves exactly as before.
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//')) + '\n'
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    return re.sub(r'\s*([{}:;,>])\s*', r'\1', source).replace(';}', '}').strip() + '\n'
+
+ASSET_MINIFIERS = {'.js': minify_js, '.css': minify_css}
+
+def build_assets():
+    """
+    Write a minified, content-hashed copy of each static .js/.css file and
+    its precompressed variants to ASSET_BUILD_DIR, remove the previous
+    build, and return the manifest of source name -> built name.
+    """
+    os.makedirs(ASSET_BUILD_DIR, exist_ok=True)
+    manifest = {}
+    written = {'manifest.json'}
+    for filename in sorted(os.listdir(app.static_folder)):
+        root, ext = os.path.splitext(filename)
+        if ext not in ASSET_MINIFIERS:
+            continue
+        with open(os.path.join(app.static_folder, filename), encoding='utf-8') as f:
+            content = ASSET_MINIFIERS[ext](f.read()).encode('utf-8')
+        
+        built = f"{root}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+        variants = {built: content, f"{built}.gz": gzip.compress(content, 9, mtime=0)}
+        if brotli:
+            variants[f"{built}.br"] = brotli.compress(content)
+        for name, data in variants.items():
+            with open(os.path.join(ASSET_BUILD_DIR, name), 'wb') as f:
+                f.write(data)
+        written.update(variants)
+        manifest[filename] = built
+    
+    for name in os.listdir(ASSET_BUILD_DIR):
+        if name not in written:
+            os.remove(os.path.join(ASSET_BUILD_DIR, name))
+    with open(ASSET_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Minify, fingerprint and precompress static assets."""
+    for source, built in build_assets().items():
+        click.echo(f"{source} -> dist/{built}")
+
+# Manifest cached by its modification time; empty until assets are built
+asset_manifest = {'mtime': None, 'files': {}}
+
+def asset_url(filename):
+    """URL of the built copy of a static file, or the file itself if it hasn't been built."""
+    try:
+        mtime = os.stat(ASSET_MANIFEST).st_mtime
+    except FileNotFoundError:
+        mtime = None
+    if mtime != asset_manifest['mtime']:
+        files = {}
+        if mtime is not None:
+            with open(ASSET_MANIFEST) as f:
+                files = json.load(f)
+        asset_manifest.update(mtime=mtime, files=files)
+    
+    built = asset_manifest['files'].get(filename)
+    if built:
+        return url_for('serve_asset', filename=built)
+    return url_for('static', filename=filename)
+
+app.jinja_env.globals['asset_url'] = asset_url
+
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """
+    Serve a built asset, picking the precompressed variant the client
+    accepts. Built names change with their content, so they are cached for
+    a year and never revalidated.
+    """
+    response = None
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        path = safe_join(ASSET_BUILD_DIR, filename + suffix)
+        if request.accept_encodings[encoding] and path and os.path.isfile(path):
+            response = send_from_directory(
+                ASSET_BUILD_DIR, filename + suffix,
+                mimetype=mimetypes.guess_type(filename)[0], max_age=ASSET_MAX_AGE
+            )
+            response.content_encoding = encoding
+            break
+    if response is None:
+        response = send_from_directory(ASSET_BUILD_DIR, filename, max_age=ASSET_MAX_AGE)
+    
+    response.vary.add('Accept-Encoding')
+    response.cache_control.immutable = True
+    return response
+
+# (strong ETag, encoding) -> compressed body, so cached payloads such as
+# /api/games are compressed once rather than on every request
+compressed_bodies = OrderedDict()
+compressed_bodies_lock = threading.Lock()
+COMPRESSED_BODIES_MAX = 128
+
+def compress_body(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, 6)
+
+@app.after_request
+def compress_response(response):
+    """
+    With COMPRESS_RESPONSES on, gzip or brotli text responses large enough
+    to benefit. Streamed and file responses are left alone (built assets
+    are precompressed). The ETag becomes weak, since the bytes differ by
+    encoding while If-None-Match still matches.
+    """
+    if (not app.config['COMPRESS_RESPONSES'] or response.status_code != 200
+            or response.direct_passthrough or response.is_streamed
+            or response.content_encoding
+            or response.mimetype not in app.config['COMPRESS_MIMETYPES']):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    accepted = request.accept_encodings
+    encoding = 'br' if brotli and accepted['br'] else 'gzip' if accepted['gzip'] else None
+    data = response.get_data()
+    if not encoding or len(data) < app.config['COMPRESS_MIN_SIZE']:
+        return response
+    
+    etag, weak = response.get_etag()
+    key = (etag, encoding) if etag and not weak else None
+    with compressed_bodies_lock:
+        compressed = compressed_bodies.get(key) if key else None
+    if compressed is None:
+        compressed = compress_body(data, encoding)
+        if key:
+            with compressed_bodies_lock:
+                compressed_bodies[key] = compressed
+                while len(compressed_bodies) > COMPRESSED_BODIES_MAX:
+                    compressed_bodies.popitem(last=False)
+    
+    response.set_data(compressed)
+    response.content_encoding = encoding
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into a single execution.
+    The first caller runs the function; callers arriving while it is in
+    flight wait for it and share its result (or its exception).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+    
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
+    
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {'done': threading.Event(), 'result': None, 'error': None}
+                self._calls[key] = call
+        
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+        
+        try:
+            call['result'] = fn()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+
+# One odds fetch per (season, week) at a time within this process
+odds_ingest = SingleFlight()
+
+class FetchBackoff:
+    """
+    Per-key retry schedule for upstream fetches that failed. After n
+    consecutive failures a key waits ODDS_RETRY_MIN * 2**(n-1), capped at
+    ODDS_TTL_MAX, before it may be fetched again; a success clears it.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures = {}  # key -> (consecutive failures, next attempt)
+    
+    def ready(self, key, now=None):
+        with self._lock:
+            entry = self._failures.get(key)
+        return entry is None or (now or datetime.utcnow()) >= entry[1]
+    
+    def failed(self, key, now=None):
+        now = now or datetime.utcnow()
+        with self._lock:
+            failures, retry_at = self._failures.get(key, (0, None))
+            if retry_at and now < retry_at:
+                # Already backing off, e.g. a caller that shared the failed fetch
+                return
+            delay = min(app.config['ODDS_RETRY_MIN'] * 2 ** failures, app.config['ODDS_TTL_MAX'])
+            self._failures[key] = (failures + 1, now + delay)
+    
+    def succeeded(self, key):
+        with self._lock:
+            self._failures.pop(key, None)
+
+# Odds fetches per (season, week) that are waiting out a failure
+odds_backoff = FetchBackoff()
+
+class LockMap:
+    """
+    In-process cache of locked weeks and game kickoff times, so pick writes
+    can be checked without querying. Loaded on first use and reloaded after
+    invalidate(), which is called whenever a week is locked or games are
+    written, or after LOCK_MAP_TTL seconds to pick up changes made by other
+    worker processes.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._weeks = None
+        self._kickoffs = None
+        self._loaded_at = 0
+    
+    def invalidate(self):
+        with self._lock:
+            self._weeks = None
+    
+    def _load(self, reload=False):
+        with self._lock:
+            expired = time.monotonic() - self._loaded_at > app.config['LOCK_MAP_TTL']
+            if self._weeks is None or reload or expired:
+                self._loaded_at = time.monotonic()
+                self._weeks = set(db.session.query(WeekLock.season, WeekLock.week))
+                self._kickoffs = {
+                    game_id: parse_commence_time(commence_time)
+                    for game_id, commence_time in db.session.query(Game.id, Game.commence_time)
+                }
+            return self._weeks, self._kickoffs
+    
+    def week_locked(self, season, week):
+        weeks, _ = self._load()
+        return (season, int(week)) in weeks
+    
+    def game_started(self, game_id, now=None):
+        if game_id is None:
+            return False
+        _, kickoffs = self._load()
+        if game_id not in kickoffs:
+            # A game written since the last load
+            _, kickoffs = self._load(reload=True)
+        kickoff = kickoffs.get(game_id)
+        return kickoff is not None and kickoff <= (now or datetime.utcnow())
+
+pick_locks = LockMap()
+
+def parse_commence_time(value):
+    """Parse an Odds API ISO timestamp into a naive UTC datetime."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+def current_nfl_week():
+    days_since_week1 = (datetime.utcnow() - NFL_2025_WEEK1_START).days
+    return max(1, min(NFL_WEEKS, days_since_week1 // 7 + 1))
+
+def week_window(week):
+    """Return the [start, end) datetimes covering an NFL week."""
+    week_start = NFL_2025_WEEK1_START + timedelta(weeks=week-1)
+    return week_start, week_start + timedelta(days=7)
+
+def serialize_games(games, bookmakers=(), markets=()):
+    """
+    Serialize games in the Odds API event shape, rebuilding each bookmakers
+    array from OddsLine rows, optionally limited to some bookmakers/markets.
+    """
+    query = db.select(
+        OddsLine.game_id, OddsLine.bookmaker, OddsLine.market, OddsLine.outcome, OddsLine.price, OddsLine.point
+    ).where(OddsLine.game_id.in_([game.id for game in games]))
+    if bookmakers:
+        query = query.where(OddsLine.bookmaker.in_(bookmakers))
+    if markets:
+        query = query.where(OddsLine.market.in_(markets))
+    
+    # game_id -> bookmaker -> market -> outcomes, in insertion order. Plain
+    # rows rather than OddsLine objects: this is read-only and hundreds of rows
+    lines = {}
+    for game_id, bookmaker, market, name, price, point in db.session.execute(query.order_by(OddsLine.id)):
+        outcome = {'name': name, 'price': price}
+        if point is not None:
+            outcome['point'] = point
+        lines.setdefault(game_id, {}).setdefault(bookmaker, {}).setdefault(market, []).append(outcome)
+    
+    return [{
+        'id': game.id,
+        'home_team': game.home_team,
+        'away_team': game.away_team,
+        'commence_time': game.commence_time,
+        'bookmakers': [{
+            'key': bookmaker,
+            'markets': [{'key': market, 'outcomes': outcomes} for market, outcomes in game_markets.items()]
+        } for bookmaker, game_markets in lines.get(game.id, {}).items()]
+    } for game in games]
+
+def odds_ttl(time_to_kickoff):
+    """How long odds stay fresh for a game kicking off after time_to_kickoff."""
+    for within, ttl in app.config['ODDS_TTL_TIERS']:
+        if time_to_kickoff <= within:
+            return ttl
+    return app.config['ODDS_TTL_MAX']
+
+def odds_refresh_due(kickoffs, now=None):
+    """
+    True when any game that has not kicked off has odds older than its TTL.
+    kickoffs is a list of (kickoff datetime, odds_updated_at) pairs.
+    """
+    now = now or datetime.utcnow()
+    for kickoff, odds_updated_at in kickoffs:
+        if kickoff <= now:
+            continue
+        if odds_updated_at is None or now - odds_updated_at >= odds_ttl(kickoff - now):
+            return True
+    return False
+
+def week_for_commence_time(game_date):
+    """Return the NFL week a kickoff falls in, or None if outside the season."""
+    week = (game_date - NFL_2025_WEEK1_START).days // 7 + 1
+    if 1 <= week <= NFL_WEEKS:
+        return week
+    return None
+
+# Serialized /api/games bodies per (season, week, bookmakers, markets), so
+# repeat requests skip loading rows and re-encoding odds. The filters come
+# from the query string, so the cache is an LRU of WEEK_PAYLOAD_CACHE_MAX
+# entries rather than growing with every distinct value requested.
+week_payload_cache = OrderedDict()
+week_payload_lock = threading.Lock()
+WEEK_PAYLOAD_CACHE_MAX = 64
+
+def invalidate_week_payload(week, season):
+    with week_payload_lock:
+        for key in [key for key in week_payload_cache if key[:2] == (season, week)]:
+            del week_payload_cache[key]
+
+def week_game_rows(week, season):
+    """A week's games as read-only rows (attribute access like Game, no ORM overhead)."""
+    return db.session.execute(db.select(
+        Game.id, Game.home_team, Game.away_team, Game.commence_time, Game.odds_updated_at
+    ).filter_by(week=week, season=season)).all()
+
+def get_week_payload(week, season, bookmakers=(), markets=()):
+    """
+    Return the cached payload for a week, rebuilding it when the stored odds
+    have changed (possibly in another worker). Returns None for empty weeks.
+    """
+    version = tuple(db.session.query(
+        db.func.max(Game.odds_updated_at),
+        db.func.count(Game.id)
+    ).filter_by(week=week, season=season).one())
+    
+    key = (season, week, bookmakers, markets)
+    with week_payload_lock:
+        entry = week_payload_cache.get(key)
+        if entry:
+            week_payload_cache.move_to_end(key)
+    if entry and entry['version'] == version:
+        return entry
+    
+    games = week_game_rows(week, season)
+    if not games:
+        return None
+    
+    data = serialize_games(games, bookmakers, markets)
+    body = app.json.dumps(data).encode('utf-8')
+    entry = {
+        'version': version,
+        'games': data,
+        'body': body,
+        'etag': hashlib.sha1(body).hexdigest(),
+        'kickoffs': [(parse_commence_time(game.commence_time), game.odds_updated_at) for game in games]
+    }
+    with week_payload_lock:
+        week_payload_cache[key] = entry
+        week_payload_cache.move_to_end(key)
+        while len(week_payload_cache) > WEEK_PAYLOAD_CACHE_MAX:
+            week_payload_cache.popitem(last=False)
+    return entry
+
+def week_payload_response(entry):
+    response = app.response_class(entry['body'], mimetype='application/json')
+    response.set_etag(entry['etag'])
+    response.cache_control.public = True
+    response.cache_control.max_age = app.config['GAMES_CACHE_MAX_AGE']
+    return response.make_conditional(request)
+
+def fetch_odds(start=None, end=None):
+    """
+    Fetch the NFL odds feed from The Odds API, limited server-side to
+    games kicking off between start and end when given.
+    """
+    params = {
+        'apiKey': ODDS_API_KEY,
+        'regions': 'us',
+        'markets': 'h2h,spreads,totals',
+        'dateFormat': 'iso',
+        'oddsFormat': 'american'
+    }
+    if start:
+        params['commenceTimeFrom'] = start.strftime('%Y-%m-%dT%H:%M:%SZ')
+    if end:
+        params['commenceTimeTo'] = end.strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    response = requests.get(ODDS_API_URL, params=params, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+def upsert_games(week, season, games_data):
+    """
+    Insert or update games keyed by uq_game_slot, so re-ingesting a week
+    refreshes odds instead of adding duplicate rows, then replace each
+    game's OddsLine rows.
+    """
+    fetched_at = datetime.utcnow()
+    rows = [{
+        'week': week,
+        'season': season,
+        'home_team': game['home_team'],
+        'away_team': game['away_team'],
+        'commence_time': game['commence_time'],
+        'odds_updated_at': fetched_at
+    } for game in games_data]
+    if not rows:
+        return
+    
+    stmt = sqlite_insert(Game).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['season', 'week', 'home_team', 'away_team', 'commence_time'],
+        set_={'odds_updated_at': stmt.excluded.odds_updated_at}
+    )
+    db.session.execute(stmt)
+    
+    game_ids = {
+        (game.home_team, game.away_team, game.commence_time): game.id
+        for game in db.session.query(Game.id, Game.home_team, Game.away_team, Game.commence_time)
+                              .filter_by(week=week, season=season)
+    }
+    store_odds_lines({
+        game_ids[(game['home_team'], game['away_team'], game['commence_time'])]: game['bookmakers']
+        for game in games_data
+    }, fetched_at)
+    invalidate_week_payload(week, season)
+    pick_locks.invalidate()
+
+def ingest_week_games(week, season):
+    """
+    Fetch and store the games for a week.
+    Concurrent callers for the same week share one upstream fetch.
+    """
+    def run():
+        # Another request may have finished ingesting while we waited
+        if Game.query.filter_by(week=week, season=season).first():
+            return
+        
+        week_start, week_end = week_window(week)
+        # commenceTimeTo is inclusive, so still drop games kicking off at week_end
+        week_games = [
+            game for game in fetch_odds(week_start, week_end)
+            if week_start <= parse_commence_time(game['commence_time']) < week_end
+        ]
+        upsert_games(week, season, week_games)
+        db.session.commit()
+    
+    odds_ingest.do((season, week), run)
+
+def refresh_week_odds(week, season):
+    """Re-pull odds for the week's games that have not kicked off yet."""
+    now = datetime.utcnow()
+    week_start, week_end = week_window(week)
+    if now >= week_end:
+        return
+    
+    upcoming = [
+        game for game in fetch_odds(max(now, week_start), week_end)
+        if parse_commence_time(game['commence_time']) < week_end
+    ]
+    upsert_games(week, season, upcoming)
+    
+    # Games the feed no longer lists (postponed, or lines taken down) count
+    # as checked too, or they would look stale and trigger a fetch every time
+    listed = {(game['home_team'], game['away_team'], game['commence_time']) for game in upcoming}
+    unlisted = [
+        game.id for game in week_game_rows(week, season)
+        if (game.home_team, game.away_team, game.commence_time) not in listed
+        and parse_commence_time(game.commence_time) > now
+    ]
+    if unlisted:
+        Game.query.filter(Game.id.in_(unlisted)).update({'odds_updated_at': now}, synchronize_session=False)
+    db.session.commit()
+
+def revalidate_week_odds(week, season):
+    """
+    Refresh a week's odds on a background thread so the caller can serve
+    the stored lines immediately (stale-while-revalidate). A failed refresh
+    puts the week in odds_backoff rather than retrying on the next request.
+    """
+    key = (season, week)
+    if odds_ingest.in_flight(key) or not odds_backoff.ready(key):
+        return
+    
+    def run():
+        with app.app_context():
+            try:
+                odds_ingest.do(key, lambda: refresh_week_odds(week, season))
+                odds_backoff.succeeded(key)
+            except Exception as e:
+                db.session.rollback()
+                odds_backoff.failed(key)
+                print(f"Error refreshing odds for week {week}: {e}")
+    
+    threading.Thread(target=run, daemon=True).start()
+
+def prefetch_season(season=2025):
+    """
+    Pull the whole season's odds feed once and store every game under its
+    week. Returns the number of games stored per week.
+    """
+    season_start, _ = week_window(1)
+    _, season_end = week_window(NFL_WEEKS)
+    
+    games_by_week = {}
+    for game in fetch_odds(season_start, season_end):
+        week = week_for_commence_time(parse_commence_time(game['commence_time']))
+        if week:
+            games_by_week.setdefault(week, []).append(game)
+    
+    for week, week_games in games_by_week.items():
+        upsert_games(week, season, week_games)
+    db.session.commit()
+    
+    return {week: len(week_games) for week, week_games in sorted(games_by_week.items())}
+
+@app.cli.command('prefetch-season')
+def prefetch_season_command():
+    """Fetch odds for all weeks of the season in one request."""
+    if not ODDS_API_KEY:
+        raise click.ClickException('ODDS_API_KEY is not set')
+    
+    counts = prefetch_season()
+    for week, count in counts.items():
+        click.echo(f"Week {week}: {count} games")
+    click.echo(f"Stored {sum(counts.values())} games across {len(counts)} weeks")
+
 @app.route('/api/games')
 def get_games():
     week = request.args.get('week', type=int)
     if not week:
         return jsonify([])
     
-    # Check if we have games for this week in the database
-    games = Game.query.filter_by(week=week, season=2025).all()
-    
-    if games:
-        # Return games from database
-        return jsonify([{
-            'home_team': game.home_team,
-            'away_team': game.away_team,
-            'commence_time': game.commence_time,
-            'bookmakers': json.loads(game.odds_data) if game.odds_data else []
-        } for game in games])
+    # Optional comma-separated filters, e.g. bookmakers=fanduel&markets=h2h,spreads
+    bookmakers = tuple(sorted({b for b in request.args.get('bookmakers', '').split(',') if b}))
+    markets = tuple(sorted({m for m in request.args.get('markets', '').split(',') if m}))
     
-    # If no games in database, fetch from API
-    if not ODDS_API_KEY:
-        return jsonify([])
+    entry = load_week_games(week, 2025, bookmakers, markets)
+    return week_payload_response(entry) if entry else jsonify([])
+
+def load_week_games(week, season, bookmakers=(), markets=()):
+    """
+    The cached games payload for a week, pulling the week from The Odds API
+    if it has never been stored. Stale odds are served as-is and refreshed
+    in the background. Returns None when there are no games; the week is
+    then not asked for again until its odds_backoff delay has passed.
+    """
+    entry = get_week_payload(week, season, bookmakers, markets)
     
-    # Calculate the date for the week
-    week_start = NFL_2025_WEEK1_START + timedelta(weeks=week-1)
-    week_end = week_start + timedelta(days=7)
+    if entry:
+        # Serve stored odds now; re-pull stale lines in the background
+        if ODDS_API_KEY and odds_refresh_due(entry['kickoffs']):
+            revalidate_week_odds(week, season)
+        return entry
     
-    # Format dates for API
-    start_date = week_start.strftime('%Y-%m-%d')
-    end_date = week_end.strftime('%Y-%m-%d')
+    # If no games in database, fetch from API
+    key = (season, week)
+    if not ODDS_API_KEY or not odds_backoff.ready(key):
+        return None
     
     try:
-        # Fetch odds from The Odds API
-        params = {
-            'apiKey': ODDS_API_KEY,
-            'regions': 'us',
-            'markets': 'h2h,spreads,totals',
-            'dateFormat': 'iso',
-            'oddsFormat': 'american'
-        }
-        
-        response = requests.get(ODDS_API_URL, params=params)
-        response.raise_for_status()
-        
-        games_data = response.json()
-        
-        # Filter games for the specific week and store in database
-        week_games = []
-        for game in games_data:
-            game_date = datetime.fromisoformat(game['commence_time'].replace('Z', '+00:00'))
-            if week_start <= game_date < week_end:
-                # Store game in database
-                db_game = Game(
-                    week=week,
-                    season=2025,
-                    home_team=game['home_team'],
-                    away_team=game['away_team'],
-                    commence_time=game['commence_time'],
-                    odds_data=json.dumps(game['bookmakers'])
-                )
-                db.session.add(db_game)
-                week_games.append({
-                    'home_team': game['home_team'],
-                    'away_team': game['away_team'],
-                    'commence_time': game['commence_time'],
-                    'bookmakers': game['bookmakers']
-                })
-        
-        db.session.commit()
-        return jsonify(week_games)
-        
+        ingest_week_games(week, season)
     except requests.RequestException as e:
+        db.session.rollback()
+        odds_backoff.failed(key)
         print(f"Error fetching games: {e}")
-        return jsonify([])
+        return None
+    
+    entry = get_week_payload(week, season, bookmakers, markets)
+    if entry:
+        odds_backoff.succeeded(key)
+    else:
+        # The feed has nothing for this week (too far out, or already played)
+        odds_backoff.failed(key)
+    return entry
+
+def serialize_snapshot(snapshot):
+    return {
+        'bookmaker': snapshot.bookmaker,
+        'market': snapshot.market,
+        'outcome': snapshot.outcome,
+        'price': snapshot.price,
+        'point': snapshot.point,
+        'recorded_at': snapshot.recorded_at.isoformat()
+    }
+
+@app.route('/api/games/<int:game_id>/lines')
+def get_game_lines(game_id):
+    """
+    Line history for a game. Without `at`, returns every recorded change in
+    order; with `at` (ISO timestamp), returns the lines in effect then.
+    Both accept optional bookmaker and market filters.
+    """
+    query = OddsSnapshot.query.filter_by(game_id=game_id)
+    columns = (OddsSnapshot.bookmaker, OddsSnapshot.market, OddsSnapshot.outcome,
+               OddsSnapshot.price, OddsSnapshot.point, OddsSnapshot.recorded_at)
+    if request.args.get('bookmaker'):
+        query = query.filter_by(bookmaker=request.args['bookmaker'])
+    if request.args.get('market'):
+        query = query.filter_by(market=request.args['market'])
+    
+    at = request.args.get('at')
+    if not at:
+        snapshots = query.with_entities(*columns).order_by(OddsSnapshot.recorded_at, OddsSnapshot.id)
+        return jsonify([serialize_snapshot(s) for s in snapshots])
+    
+    try:
+        at = parse_commence_time(at)
+    except ValueError:
+        return jsonify({'error': 'Invalid timestamp'}), 400
+    
+    # Snapshots are appended in time order, so the highest id per outcome is its latest line
+    latest = query.filter(OddsSnapshot.recorded_at <= at).with_entities(
+        db.func.max(OddsSnapshot.id)
+    ).group_by(OddsSnapshot.bookmaker, OddsSnapshot.market, OddsSnapshot.outcome)
+    snapshots = db.session.query(*columns).filter(OddsSnapshot.id.in_(latest)).order_by(OddsSnapshot.id)
+    return jsonify([serialize_snapshot(s) for s in snapshots])
 
 @app.route('/api/picks', methods=['GET'])
 def get_picks():
     week = request.args.get('week', type=int)
     if not week:
         return jsonify({})
-    
-    picks = Pick.query.filter_by(week=week, season=2025).all()
+    return jsonify(week_picks(week, 2025))
+
+def week_picks(week, season):
+    """A week's picks as {player: {category: value}}."""
+    # One joined query instead of a lazy player load per pick
+    picks = db.session.query(Player.name, Pick.category, Pick.value).join(
+        Pick, Pick.player_id == Player.id
+    ).filter(Pick.week == week, Pick.season == season).all()
     
     result = {}
-    for pick in picks:
-        player_name = pick.player.name
+    for player_name, category, value in picks:
         if player_name not in result:
             result[player_name] = {}
-        result[player_name][pick.category] = pick.value
-    
-    return jsonify(result)
+        result[player_name][category] = value
+    return result
 
 @app.route('/api/picks', methods=['POST'])
 def save_pick():
@@ -347,6 +1375,12 @@ def save_pick():
     
     if not all([week, player_name, category, value]):
         return jsonify({'error': 'Missing required fields'}), 400
+    try:
+        week = int(week)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Week must be a number'}), 400
+    if pick_locks.week_locked(2025, week):
+        return jsonify({'error': f'Week {week} is locked'}), 400
     
     try:
         # Get or create player
@@ -365,8 +1399,11 @@ def save_pick():
         ).first()
         
         if existing_pick:
+            if pick_locks.game_started(existing_pick.game_id):
+                return jsonify({'error': f'{existing_pick.value} has already kicked off'}), 400
             # Update existing pick
-            existing_pick.value = value
+            pick = existing_pick
+            pick.value = value
         else:
             # Create new pick
             pick = Pick(
@@ -378,6 +1415,11 @@ def save_pick():
             )
             db.session.add(pick)
         
+        # Record which game and line the pick is on so grading can look it up
+        link_picks([pick])
+        if pick_locks.game_started(pick.game_id):
+            db.session.rollback()
+            return jsonify({'error': f'{value} has already kicked off'}), 400
         db.session.commit()
         return jsonify({'success': True})
         
@@ -385,61 +1427,303 @@ def save_pick():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/picks/batch', methods=['POST'])
+def save_picks_batch():
+    """
+    Submit a card of picks for a week in one transaction. Body is
+    {"week": 1, "picks": {"Player": {"Category": "value", ...}, ...}}, the
+    same shape GET /api/picks returns. Every pick is validated against the
+    week's games, and Favorite/Underdog picks against the side of the
+    PICK_LINE_BOOKMAKER spread, before anything is written; any error
+    rejects the batch. Picks that match what's already saved are skipped
+    unchecked, so a line that has moved since doesn't block the rest.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Missing required fields'}), 400
+    week = data.get('week')
+    picks = data.get('picks')
+    
+    if not week or not isinstance(picks, dict) or not picks:
+        return jsonify({'error': 'Missing required fields'}), 400
+    try:
+        week = int(week)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Week must be a number'}), 400
+    
+    if pick_locks.week_locked(2025, week):
+        return jsonify({'error': f'Week {week} is locked'}), 400
+    
+    games = Game.query.filter_by(week=week, season=2025).all()
+    # Games the current picks are on, which can't be changed once started
+    current_games = {
+        (player_name, category): (value, game_id)
+        for player_name, category, value, game_id in db.session.query(
+            Player.name, Pick.category, Pick.value, Pick.game_id
+        ).join(Pick, Pick.player_id == Player.id).filter(Pick.week == week, Pick.season == 2025)
+    }
+    rows = []
+    errors = []
+    for player_name, categories in picks.items():
+        if not player_name.strip():
+            errors.append('Player name is required')
+            continue
+        if not isinstance(categories, dict):
+            errors.append(f'{player_name}: picks must map category to value')
+            continue
+        for category, value in categories.items():
+            if not value:
+                continue
+            if category not in PICK_CATEGORIES:
+                errors.append(f'{player_name}: unknown category {category}')
+                continue
+            if not isinstance(value, str):
+                errors.append(f'{player_name}: {category} pick must be a string')
+                continue
+            current_value, current_game_id = current_games.get((player_name, category), (None, None))
+            if current_value == value:
+                continue
+            game, line = resolve_pick(category, value, games)
+            if not game:
+                errors.append(f'{player_name}: {value} is not a week {week} game')
+                continue
+            # Favorites give points (a negative spread), underdogs get them
+            if category == 'Favorite' and not (line is not None and line < 0):
+                errors.append(f'{player_name}: {value} is not favored')
+                continue
+            if category == 'Underdog' and not (line is not None and line > 0):
+                errors.append(f'{player_name}: {value} is not an underdog')
+                continue
+            if pick_locks.game_started(current_game_id):
+                errors.append(f'{player_name}: {current_value} has already kicked off')
+                continue
+            if pick_locks.game_started(game.id):
+                errors.append(f'{player_name}: {value} has already kicked off')
+                continue
+            rows.append({
+                'week': week,
+                'season': 2025,
+                'player_name': player_name,
+                'category': category,
+                'value': value,
+                'game_id': game.id,
+                'line': line
+            })
+    
+    if errors:
+        return jsonify({'error': 'Invalid picks', 'errors': errors}), 400
+    if not rows:
+        return jsonify({'success': True, 'saved': 0})
+    
+    try:
+        # Create any new players, then upsert every pick in one statement
+        names = {row['player_name'] for row in rows}
+        db.session.execute(
+            sqlite_insert(Player).values([{'name': name} for name in names]).on_conflict_do_nothing()
+        )
+        player_ids = dict(db.session.query(Player.name, Player.id).filter(Player.name.in_(names)))
+        for row in rows:
+            row['player_id'] = player_ids[row.pop('player_name')]
+        
+        upsert_picks(rows)
+        db.session.commit()
+        return jsonify({'success': True, 'saved': len(rows)})
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/leaderboard')
 def leaderboard_page():
     return render_template('leaderboard.html')
 
+def leaderboard_form(season):
+    """
+    Season totals plus rolling last-N-week form per player, computed with
+    window functions over the player's Standing rows and read off their
+    latest week.
+    """
+    score_map = app.config['LEADERBOARD_SCORE_MAP']
+    points = (Standing.wins * score_map.get('win', 0)
+              + Standing.ties * score_map.get('tie', 0)
+              + Standing.losses * score_map.get('loss', 0))
+    stats = {'wins': Standing.wins, 'losses': Standing.losses, 'ties': Standing.ties, 'points': points}
+    by_week = {'partition_by': Standing.player_id, 'order_by': Standing.week}
+    
+    columns = [
+        Standing.player_id,
+        db.func.row_number().over(partition_by=Standing.player_id, order_by=Standing.week.desc()).label('latest'),
+        db.func.sum(Standing.total_picks).over(rows=(None, 0), **by_week).label('total_picks')
+    ]
+    for name, expr in stats.items():
+        columns.append(db.func.sum(expr).over(rows=(None, 0), **by_week).label(name))
+    for n in app.config['LEADERBOARD_FORM_WINDOWS']:
+        for name, expr in stats.items():
+            columns.append(db.func.sum(expr).over(rows=(-(n - 1), 0), **by_week).label(f'last{n}_{name}'))
+    
+    form = db.select(*columns).where(Standing.season == season).subquery()
+    return db.session.execute(
+        db.select(Player.name, form).join(form, form.c.player_id == Player.id).where(form.c.latest == 1)
+    ).mappings().all()
+
 @app.route('/api/leaderboard')
 def leaderboard_api():
-    # Get all results grouped by player
-    results = db.session.query(
-        Player.name,
-        db.func.count(Result.id).label('total_picks'),
-        db.func.sum(db.case((Result.outcome == 'win', 1), else_=0)).label('wins'),
-        db.func.sum(db.case((Result.outcome == 'loss', 1), else_=0)).label('losses'),
-        db.func.sum(db.case((Result.outcome == 'tie', 1), else_=0)).label('ties')
-    ).join(Result, Player.id == Result.player_id).group_by(Player.id, Player.name).all()
+    season = request.args.get('season', 2025, type=int)
     
     leaderboard = []
-    for result in results:
-        total_picks = result.total_picks or 0
-        wins = result.wins or 0
-        losses = result.losses or 0
-        ties = result.ties or 0
+    for result in leaderboard_form(season):
+        total_picks = result['total_picks'] or 0
+        wins = result['wins'] or 0
+        losses = result['losses'] or 0
+        ties = result['ties'] or 0
         
         if total_picks > 0:
             win_percentage = (wins / total_picks) * 100
-            leaderboard.append({
-                'player': result.name,
+            entry = {
+                'player': result['name'],
                 'wins': wins,
                 'losses': losses,
                 'ties': ties,
                 'total_picks': total_picks,
-                'win_percentage': round(win_percentage, 1)
-            })
+                'win_percentage': round(win_percentage, 1),
+                'total_points': result['points'],
+                'record': f"{wins}-{losses}-{ties}",
+                'win_pct': round((wins + 0.5 * ties) / total_picks, 3)
+            }
+            for n in app.config['LEADERBOARD_FORM_WINDOWS']:
+                entry[f'last{n}_points'] = result[f'last{n}_points']
+                entry[f'last{n}_record'] = f"{result[f'last{n}_wins']}-{result[f'last{n}_losses']}-{result[f'last{n}_ties']}"
+            leaderboard.append(entry)
     
-    # Sort by win percentage (descending)
-    leaderboard.sort(key=lambda x: x['win_percentage'], reverse=True)
+    # Sort by points, then win percentage (descending)
+    leaderboard.sort(key=lambda x: (x['total_points'], x['win_percentage']), reverse=True)
     
     return jsonify(leaderboard)
 
+RosterPlayer = namedtuple('RosterPlayer', ['name', 'team', 'pos', 'depth'])
+
+class RosterIndex:
+    """
+    Immutable in-memory index over a list of RosterPlayers, by team and by
+    (team, position), with prefix and fuzzy name search. A player listed
+    under more than one team is indexed under each (seed_rosters warns about
+    them), so picks saved against either team keep their option.
+    """
+    def __init__(self, players):
+        players = list(players)
+        by_team = {}
+        by_team_position = {}
+        for player in players:
+            by_team.setdefault(player.team, []).append(player)
+            by_team_position.setdefault((player.team, player.pos), []).append(player)
+        
+        self.players = tuple(players)
+        self.by_team = MappingProxyType({team: tuple(p) for team, p in by_team.items()})
+        self.by_team_position = MappingProxyType({key: tuple(p) for key, p in by_team_position.items()})
+        # Normalized full names, plus (word, player index) pairs sorted for
+        # prefix search on any part of a name ("mah" finds Patrick Mahomes)
+        names = [normalize_player_name(player.name) for player in players]
+        self._prefixes = tuple(sorted(
+            (token, i)
+            for i, name in enumerate(names)
+            for token in {name, *name.split()}
+        ))
+        self._tokens = tuple(sorted({token for token, _ in self._prefixes}))
+    
+    def for_teams(self, teams, position=None):
+        if position:
+            return [p for team in teams for p in self.by_team_position.get((team, position), ())]
+        return [p for team in teams for p in self.by_team.get(team, ())]
+    
+    def _matching(self, prefix, exact=False):
+        """Indexes of players with a name or name word starting with (or equal to) prefix."""
+        i = bisect.bisect_left(self._prefixes, (prefix,))
+        while i < len(self._prefixes):
+            token, player = self._prefixes[i]
+            if not (token == prefix if exact else token.startswith(prefix)):
+                break
+            yield player
+            i += 1
+    
+    def search(self, query, teams=None, limit=10):
+        """
+        Players whose name or any word of it starts with query; if none do,
+        players with a name or name word close to it ("saquan" -> Saquon).
+        """
+        query = normalize_player_name(query)
+        if not query:
+            return []
+        
+        matches = dict.fromkeys(self._matching(query))
+        if not matches:
+            # Misspellings rarely get the first letter wrong; only compare those words
+            start = bisect.bisect_left(self._tokens, query[0])
+            end = bisect.bisect_left(self._tokens, chr(ord(query[0]) + 1))
+            for token in difflib.get_close_matches(query, self._tokens[start:end], n=limit, cutoff=0.75):
+                matches.update(dict.fromkeys(self._matching(token, exact=True)))
+        
+        players = (self.players[i] for i in matches)
+        if teams:
+            players = (p for p in players if p.team in teams)
+        return [p for _, p in zip(range(limit), players)]
+
+class RosterService:
+    """
+    Serves a RosterIndex of the active NFLPlayer rows, rebuilding it when
+    `flask seed` records a new roster checksum (in any process). The
+    checksum is read at most once per ROSTER_RELOAD_INTERVAL seconds, so
+    lookups in between never touch SQLite.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+        self._checksum = None
+        self._checked_at = 0
+    
+    def index(self):
+        now = time.monotonic()
+        if self._index is None or now - self._checked_at > app.config['ROSTER_RELOAD_INTERVAL']:
+            with self._lock:
+                self._checked_at = now
+                checksum = db.session.execute(
+                    db.select(DataVersion.checksum).where(DataVersion.name == 'rosters')
+                ).scalar()
+                if self._index is None or checksum != self._checksum:
+                    self._index = RosterIndex(
+                        RosterPlayer(name, team, position, depth)
+                        for name, team, position, depth in db.session.execute(
+                            db.select(NFLPlayer.name, NFLPlayer.team, NFLPlayer.position, NFLPlayer.depth)
+                            .where(NFLPlayer.active.is_(True))
+                            .order_by(NFLPlayer.team, NFLPlayer.id)
+                        )
+                    )
+                    self._checksum = checksum
+        return self._index
+
+rosters = RosterService()
+
+def serialize_roster_player(player):
+    return {'name': player.name, 'team': player.team, 'pos': player.pos, 'depth': player.depth}
+
+def request_teams():
+    return [team.strip().upper() for team in request.args.get('teams', '').split(',') if team.strip()]
+
 @app.route('/api/starters')
 def get_starters():
-    teams = request.args.get('teams', '').split(',')
-    if not teams or teams[0] == '':
+    teams = request_teams()
+    if not teams:
         return jsonify([])
-    
-    # Get active players for the specified teams
-    players = NFLPlayer.query.filter(
-        NFLPlayer.team.in_(teams),
-        NFLPlayer.active == True
-    ).all()
-    
-    return jsonify([{
-        'name': player.name,
-        'team': player.team,
-        'pos': player.position
-    } for player in players])
+    return jsonify(starters_for_teams(teams, request.args.get('pos')))
+
+@app.route('/api/starters/search')
+def search_starters():
+    """Typeahead over roster names: ?q=mah, optionally limited to teams= and limit=."""
+    limit = max(1, min(request.args.get('limit', 10, type=int), 50))
+    players = rosters.index().search(request.args.get('q', ''), request_teams(), limit)
+    return jsonify([serialize_roster_player(player) for player in players])
+
+def starters_for_teams(teams, position=None):
+    return [serialize_roster_player(player) for player in rosters.index().for_teams(teams, position)]
 
 # Remove the separate results route since we're combining it with picks
 # @app.route('/results')
@@ -451,29 +1735,27 @@ def get_results():
     week = request.args.get('week', type=int)
     if not week:
         return jsonify({})
-    
-    # Get all results for the week
-    results = Result.query.filter_by(week=week, season=2025).all()
+    return jsonify(week_results(week, 2025))
+
+def week_results(week, season):
+    """A week's graded results as {player: {category: {outcome, pick}}}."""
+    # Get all results for the week with their player and original pick in one query
+    results = db.session.query(Player.name, Result.category, Result.outcome, Pick.value).join(
+        Result, Result.player_id == Player.id
+    ).outerjoin(
+        Pick, Pick.id == Result.pick_id
+    ).filter(Result.week == week, Result.season == season).all()
     
     result_data = {}
-    for result in results:
-        player_name = result.player.name
+    for player_name, category, outcome, pick_value in results:
         if player_name not in result_data:
             result_data[player_name] = {}
         
-        # Get the original pick value
-        pick_value = ""
-        if result.pick_id:
-            pick = Pick.query.get(result.pick_id)
-            if pick:
-                pick_value = pick.value
-        
-        result_data[player_name][result.category] = {
-            'outcome': result.outcome,
-            'pick': pick_value
+        result_data[player_name][category] = {
+            'outcome': outcome,
+            'pick': pick_value or ""
         }
-    
-    return jsonify(result_data)
+    return result_data
 
 @app.route('/api/results', methods=['POST'])
 def save_result():
@@ -485,6 +1767,10 @@ def save_result():
     
     if not all([week, player_name, category, outcome]):
         return jsonify({'error': 'Missing required fields'}), 400
+    try:
+        week = int(week)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Week must be a number'}), 400
     
     try:
         # Get player
@@ -499,6 +1785,8 @@ def save_result():
             player_id=player.id,
             category=category
         ).first()
+        if pick and pick.game_id and not pick_locks.game_started(pick.game_id):
+            return jsonify({'error': f"{pick.value} hasn't kicked off yet"}), 400
         
         # Check if result already exists
         existing_result = Result.query.filter_by(
@@ -525,6 +1813,7 @@ def save_result():
             )
             db.session.add(result)
         
+        refresh_standings(2025, week, [player.id])
         db.session.commit()
         return jsonify({'success': True})
         
@@ -555,6 +1844,7 @@ def lock_week():
         )
         db.session.add(lock)
         db.session.commit()
+        pick_locks.invalidate()
         
         return jsonify({'success': True, 'message': f'Week {week} locked successfully'})
         
@@ -564,20 +1854,182 @@ def lock_week():
 
 @app.route('/api/week/lock/<int:week>')
 def get_week_lock_status(week):
-    lock = WeekLock.query.filter_by(week=week, season=2025).first()
+    return jsonify(week_lock_status(week, 2025))
+
+def week_lock_status(week, season):
+    lock = WeekLock.query.filter_by(week=week, season=season).first()
+    if not lock:
+        return {'locked': False, 'locked_at': None, 'locked_by': None}
+    return {
+        'locked': True,
+        'locked_at': lock.locked_at.isoformat(),
+        'locked_by': lock.locked_by
+    }
+
+def upsert_picks(rows):
+    """Insert or update Pick rows keyed by week/season/player/category in one statement."""
+    if not rows:
+        return
+    stmt = sqlite_insert(Pick).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['week', 'season', 'player_id', 'category'],
+        set_={
+            'value': stmt.excluded.value,
+            'game_id': stmt.excluded.game_id,
+            'line': stmt.excluded.line
+        }
+    )
+    db.session.execute(stmt)
+
+def upsert_results(rows):
+    """Insert or update Result rows keyed by uq_result_slot in one statement."""
+    if not rows:
+        return
+    stmt = sqlite_insert(Result).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['week', 'season', 'player_id', 'category'],
+        set_={'outcome': stmt.excluded.outcome, 'pick_id': stmt.excluded.pick_id}
+    )
+    db.session.execute(stmt)
+
+# Picks settled against the final score and a spread/total line
+LINE_CATEGORIES = ('Moneyline', 'Favorite', 'Underdog', 'Over', 'Under')
+PICK_CATEGORIES = LINE_CATEGORIES + ('Touchdown Scorer',)
+
+def settle_line_picks(season, weeks, final_only=True):
+    """
+    Settle every Moneyline/Favorite/Underdog/Over/Under pick for the given
+    weeks in one SQL statement from GameResult scores and the line stored on
+    the pick (falling back to the current PICK_LINE_BOOKMAKER spread). A
+    margin of exactly zero, e.g. a 7-point win on a -7 spread, is a tie.
+    Picks without a final score or a line are left out, unless final_only
+    is False, which settles in-progress games on the current score.
+    Returns Result rows.
+    """
+    picked_home = Pick.value == Game.home_team
+    picked_score = db.case((picked_home, GameResult.home_score), else_=GameResult.away_score)
+    opponent_score = db.case((picked_home, GameResult.away_score), else_=GameResult.home_score)
+    total = GameResult.home_score + GameResult.away_score
+    current_spread = db.select(OddsLine.point).where(
+        OddsLine.game_id == Pick.game_id,
+        OddsLine.bookmaker == app.config['PICK_LINE_BOOKMAKER'],
+        OddsLine.market == 'spreads',
+        OddsLine.outcome == Pick.value
+    ).scalar_subquery()
     
-    if lock:
-        return jsonify({
-            'locked': True,
-            'locked_at': lock.locked_at.isoformat(),
-            'locked_by': lock.locked_by
-        })
-    else:
-        return jsonify({
-            'locked': False,
-            'locked_at': None,
-            'locked_by': None
+    # Positive margin wins, negative loses, zero pushes
+    margin = db.case(
+        (Pick.category == 'Moneyline', picked_score - opponent_score),
+        (Pick.category.in_(('Favorite', 'Underdog')),
+         picked_score - opponent_score + db.func.coalesce(Pick.line, current_spread)),
+        (Pick.category == 'Over', total - Pick.line),
+        (Pick.category == 'Under', Pick.line - total)
+    )
+    outcome = db.case((margin > 0, 'win'), (margin < 0, 'loss'), else_='tie')
+    
+    query = db.select(
+        Pick.week,
+        Pick.season,
+        Pick.player_id,
+        Pick.category,
+        outcome.label('outcome'),
+        Pick.id.label('pick_id')
+    ).join(Game, Game.id == Pick.game_id).join(GameResult, GameResult.game_id == Game.id).where(
+        Pick.season == season,
+        Pick.week.in_(weeks),
+        Pick.category.in_(LINE_CATEGORIES),
+        margin.isnot(None)
+    )
+    if final_only:
+        query = query.where(GameResult.final.is_(True))
+    return [dict(row) for row in db.session.execute(query).mappings()]
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+def normalize_player_name(name):
+    """Lowercase a player name and drop punctuation and suffixes ("D.J. Moore Jr." -> "dj moore")."""
+    name = re.sub(r"[.'`]", '', name.lower()).replace('-', ' ')
+    return ' '.join(word for word in name.split() if word not in NAME_SUFFIXES)
+
+# season -> (team, normalized pick name) -> normalized scorer name it fuzzily matched
+touchdown_name_cache = {}
+
+def scored_touchdown(name, team, scorers, season):
+    """
+    True if the picked player is among a team's scorers for a game, where
+    scorers is a set of normalized names. Near-miss spellings are matched
+    fuzzily and remembered for the rest of the season.
+    """
+    normalized = normalize_player_name(name)
+    if normalized in scorers:
+        return True
+    
+    aliases = touchdown_name_cache.setdefault(season, {})
+    alias = aliases.get((team, normalized))
+    if alias:
+        return alias in scorers
+    
+    close = difflib.get_close_matches(normalized, scorers, n=1, cutoff=0.85)
+    if close:
+        aliases[(team, normalized)] = close[0]
+        return True
+    return False
+
+def settle_touchdown_picks(season, weeks):
+    """
+    Settle every Touchdown Scorer pick for the given weeks against the stored
+    scorers of its game: a win if the player scored, otherwise a loss. Picks
+    whose game has no scorers loaded yet are left out. Returns Result rows.
+    """
+    picks = db.session.query(Pick).join(GameResult, GameResult.game_id == Pick.game_id).filter(
+        Pick.season == season,
+        Pick.week.in_(weeks),
+        Pick.category == 'Touchdown Scorer',
+        GameResult.touchdowns_loaded.is_(True)
+    ).all()
+    
+    # (game_id, team) -> normalized scorer names
+    scorers = {}
+    for scorer in TouchdownScorer.query.filter(TouchdownScorer.game_id.in_({pick.game_id for pick in picks})):
+        scorers.setdefault((scorer.game_id, scorer.team), set()).add(normalize_player_name(scorer.name))
+    
+    rows = []
+    for pick in picks:
+        match = PLAYER_PICK_PATTERN.match(pick.value)
+        if not match:
+            continue
+        name, team = match.groups()
+        scored = scored_touchdown(name, team, scorers.get((pick.game_id, team), set()), season)
+        rows.append({
+            'week': pick.week,
+            'season': season,
+            'player_id': pick.player_id,
+            'category': pick.category,
+            'outcome': 'win' if scored else 'loss',
+            'pick_id': pick.id
         })
+    return rows
+
+def grade_picks(season, weeks):
+    """
+    Grade every pick for the given weeks as one batch: make sure scores are
+    cached, settle the picks in SQL, bulk upsert the outcomes and refresh
+    standings. Returns the number of results written.
+    """
+    pick_weeks = [week for (week,) in db.session.query(Pick.week).filter(
+        Pick.season == season, Pick.week.in_(weeks)
+    ).distinct()]
+    for week in pick_weeks:
+        fetch_game_results(week, season)
+        db.session.flush()
+        fetch_touchdown_scorers(week, season)
+    db.session.flush()
+    
+    rows = settle_line_picks(season, pick_weeks) + settle_touchdown_picks(season, pick_weeks)
+    upsert_results(rows)
+    for week in pick_weeks:
+        refresh_standings(season, week)
+    return len(rows)
 
 @app.route('/api/results/calculate', methods=['POST'])
 def calculate_results():
@@ -588,43 +2040,7 @@ def calculate_results():
         return jsonify({'error': 'Week is required'}), 400
     
     try:
-        # Get all picks for the week
-        picks = Pick.query.filter_by(week=week, season=2025).all()
-        
-        # Get game results
-        game_results = fetch_game_results(week, 2025)
-        
-        # Get games for reference
-        games = Game.query.filter_by(week=week, season=2025).all()
-        
-        calculated_count = 0
-        for pick in picks:
-            outcome = calculate_pick_outcome(pick, game_results, games)
-            if outcome:
-                # Check if result already exists
-                existing_result = Result.query.filter_by(
-                    week=week,
-                    season=2025,
-                    player_id=pick.player_id,
-                    category=pick.category
-                ).first()
-                
-                if existing_result:
-                    existing_result.outcome = outcome
-                    existing_result.pick_id = pick.id
-                else:
-                    result = Result(
-                        week=week,
-                        season=2025,
-                        player_id=pick.player_id,
-                        category=pick.category,
-                        outcome=outcome,
-                        pick_id=pick.id
-                    )
-                    db.session.add(result)
-                
-                calculated_count += 1
-        
+        calculated_count = grade_picks(2025, [int(week)])
         db.session.commit()
         
         return jsonify({
@@ -636,111 +2052,390 @@ def calculate_results():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-def fetch_game_results(week, season):
+@app.cli.command('grade')
+@click.option('--season', default=2025, show_default=True)
+@click.option('--week', type=int, help='Grade a single week instead of the whole season.')
+def grade_command(season, week):
+    """Grade picks and rewrite results for a week or a whole season."""
+    weeks = [week] if week else list(range(1, NFL_WEEKS + 1))
+    count = grade_picks(season, weeks)
+    db.session.commit()
+    click.echo(f"Graded {count} picks")
+
+# Pick/result history as flat records, the shape used by the importer and
+# exporter: a record carries a pick value, an outcome, or both
+HISTORY_FIELDS = ['season', 'week', 'player', 'category', 'value', 'outcome']
+OUTCOMES = ('win', 'loss', 'tie')
+
+def read_legacy_history(path):
     """
-    Fetch game results from external API.
-    This is a placeholder that would integrate with a real sports API.
-    """
-    # For now, return mock data structure
-    # In production, this would call an API like:
-    # - ESPN API
-    # - NFL API
-    # - SportsData.io
-    # - The Odds API (for live scores)
-    
-    mock_results = {
-        # Example structure for real API integration
-        "Kansas City Chiefs @ Baltimore Ravens": {
-            "home_score": 24,
-            "away_score": 21,
-            "final": True,
-            "spread": -3.5,  # Baltimore was favored by 3.5
-            "total": 45.5,
-            "moneyline_winner": "Baltimore Ravens",
-            "spread_winner": "Kansas City Chiefs",  # KC covered the spread
-            "total_result": "under"  # 45 total < 45.5
-        }
+    Records from the old app's picks.json/results.json, keyed
+    {"2025-1": {player: {category: value}}}. Values that are outcomes are
+    results; anything else is a pick. These files are small, so they are
+    parsed whole.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    for key, players in data.items():
+        season, week = (int(part) for part in key.split('-'))
+        for player, categories in players.items():
+            for category, value in categories.items():
+                field = 'outcome' if value in OUTCOMES else 'value'
+                yield {'season': season, 'week': week, 'player': player, 'category': category, field: value}
+
+def read_ndjson_history(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def read_csv_history(path):
+    with open(path, newline='') as f:
+        yield from csv.DictReader(f)
+
+HISTORY_READERS = {
+    '.json': read_legacy_history,
+    '.ndjson': read_ndjson_history,
+    '.jsonl': read_ndjson_history,
+    '.csv': read_csv_history
+}
+
+def import_history(records, batch_size=500):
+    """
+    Upsert an iterable of history records in batches of batch_size, each in
+    its own transaction with the standings for the weeks it touched, so
+    memory stays flat and re-importing the same data changes nothing.
+    Returns a Counter of picks, results and skipped records.
+    """
+    counts = Counter()
+    player_ids = {}
+    games_by_week = {}
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            import_history_batch(batch, player_ids, games_by_week, counts)
+            batch = []
+    if batch:
+        import_history_batch(batch, player_ids, games_by_week, counts)
+    return counts
+
+def import_history_batch(records, player_ids, games_by_week, counts):
+    entries = []
+    for record in records:
+        try:
+            season, week = int(record['season']), int(record['week'])
+        except (KeyError, TypeError, ValueError):
+            counts['skipped'] += 1
+            continue
+        fields = [record.get(field) for field in ('player', 'category', 'value', 'outcome')]
+        if not all(field is None or isinstance(field, str) for field in fields):
+            counts['skipped'] += 1
+            continue
+        player, category, value, outcome = fields
+        player = (player or '').strip()
+        value = value or None
+        outcome = outcome or None
+        if not player or category not in PICK_CATEGORIES or not (value or outcome) or outcome not in (None, *OUTCOMES):
+            counts['skipped'] += 1
+            continue
+        entries.append((season, week, player, category, value, outcome))
+    if not entries:
+        return
+    
+    new_players = {entry[2] for entry in entries} - player_ids.keys()
+    if new_players:
+        db.session.execute(
+            sqlite_insert(Player).values([{'name': name} for name in new_players]).on_conflict_do_nothing()
+        )
+        player_ids.update(db.session.query(Player.name, Player.id).filter(Player.name.in_(new_players)))
+    
+    pick_rows = []
+    for season, week, player, category, value, outcome in entries:
+        if not value:
+            continue
+        if (season, week) not in games_by_week:
+            games_by_week[season, week] = Game.query.filter_by(week=week, season=season).all()
+        game, line = resolve_pick(category, value, games_by_week[season, week])
+        pick_rows.append({
+            'week': week,
+            'season': season,
+            'player_id': player_ids[player],
+            'category': category,
+            'value': value,
+            'game_id': game.id if game else None,
+            'line': line
+        })
+    upsert_picks(pick_rows)
+    
+    result_slots = {
+        (week, season, player_ids[player], category): outcome
+        for season, week, player, category, value, outcome in entries if outcome
     }
+    if result_slots:
+        slot = db.tuple_(Pick.week, Pick.season, Pick.player_id, Pick.category)
+        pick_ids = {
+            (week, season, player_id, category): pick_id
+            for pick_id, week, season, player_id, category in db.session.query(
+                Pick.id, Pick.week, Pick.season, Pick.player_id, Pick.category
+            ).filter(slot.in_(list(result_slots)))
+        }
+        upsert_results([{
+            'week': week,
+            'season': season,
+            'player_id': player_id,
+            'category': category,
+            'outcome': outcome,
+            'pick_id': pick_ids.get((week, season, player_id, category))
+        } for (week, season, player_id, category), outcome in result_slots.items()])
+        for week, season in {(week, season) for week, season, _, _ in result_slots}:
+            refresh_standings(season, week)
     
-    return mock_results
+    db.session.commit()
+    counts['picks'] += len(pick_rows)
+    counts['results'] += len(result_slots)
 
-def calculate_pick_outcome(pick, game_results, games):
+def export_history(season):
     """
-    Calculate the outcome of a pick based on game results.
+    Yield a season's history records in week/player/category order: every
+    pick with its result, then results that have no pick. Rows are fetched
+    from the database in chunks rather than loaded all at once.
     """
-    if not game_results:
-        return None
-    
-    # Find the game this pick relates to
-    game = None
-    for g in games:
-        game_key = f"{g.away_team} @ {g.home_team}"
-        if game_key in game_results:
-            game = game_results[game_key]
-            break
+    same_slot = db.and_(
+        Result.week == Pick.week,
+        Result.season == Pick.season,
+        Result.player_id == Pick.player_id,
+        Result.category == Pick.category
+    )
+    picks = db.select(
+        Pick.season, Pick.week, Player.name.label('player'), Pick.category, Pick.value, Result.outcome
+    ).join(Player, Player.id == Pick.player_id).outerjoin(Result, same_slot).where(Pick.season == season)
+    results_without_picks = db.select(
+        Result.season, Result.week, Player.name.label('player'), Result.category,
+        db.null().label('value'), Result.outcome
+    ).join(Player, Player.id == Result.player_id).where(
+        Result.season == season,
+        ~db.select(Pick.id).where(same_slot).exists()
+    )
+    query = db.union_all(picks, results_without_picks).order_by('week', 'player', 'category')
     
-    if not game or not game.get('final'):
-        return None
+    for row in db.session.execute(query, execution_options={'yield_per': 1000}).mappings():
+        yield dict(row)
+
+@app.cli.command('import-history')
+@click.argument('paths', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--batch-size', default=500, show_default=True)
+def import_history_command(paths, batch_size):
+    """Import picks and results from legacy .json, .ndjson/.jsonl or .csv files."""
+    for path in paths:
+        reader = HISTORY_READERS.get(os.path.splitext(path)[1].lower())
+        if not reader:
+            raise click.BadParameter(f"{path}: expected .json, .ndjson, .jsonl or .csv")
+        counts = import_history(reader(path), batch_size)
+        click.echo(f"{path}: {counts['picks']} picks, {counts['results']} results, {counts['skipped']} skipped")
+
+@app.cli.command('export-history')
+@click.option('--season', default=2025, show_default=True)
+@click.option('--format', 'output_format', type=click.Choice(['ndjson', 'csv']), default='ndjson', show_default=True)
+@click.argument('output', type=click.File('w'), default='-')
+def export_history_command(season, output_format, output):
+    """Stream a season's picks and results to OUTPUT (default stdout)."""
+    records = export_history(season)
+    if output_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=HISTORY_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    else:
+        for record in records:
+            output.write(json.dumps(record) + '\n')
+
+class ScoreProvider(ABC):
+    """
+    Source of game scores. fetch_scores() returns scores for the requested
+    games keyed "Away @ Home", each a dict with home_score, away_score and
+    final; games the provider knows nothing about are left out.
+    """
+    @abstractmethod
+    def fetch_scores(self, week, season, games):
+        ...
     
-    pick_value = pick.value
+    def fetch_touchdowns(self, week, season, games):
+        """
+        Touchdown scorers for the requested games keyed "Away @ Home", each a
+        list of {"name", "team"} dicts. Providers without player data return {}.
+        """
+        return {}
+
+class OddsApiScoreProvider(ScoreProvider):
+    """Scores from The Odds API, which covers live games and the last 3 days."""
+    def __init__(self, api_key):
+        self.api_key = api_key
+        # Reuse connections across polls instead of a new handshake per call
+        self.session = requests.Session()
+        self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=2))
     
-    if pick.category == "Moneyline":
-        # Check if the picked team won
-        if pick_value == game.get('moneyline_winner'):
-            return "win"
-        else:
-            return "loss"
+    def fetch_scores(self, week, season, games):
+        response = self.session.get(SCORES_API_URL, params={
+            'apiKey': self.api_key,
+            'daysFrom': 3,
+            'dateFormat': 'iso'
+        }, timeout=10)
+        response.raise_for_status()
+        
+        wanted = {f"{game.away_team} @ {game.home_team}" for game in games}
+        scores = {}
+        for event in response.json():
+            game_key = f"{event['away_team']} @ {event['home_team']}"
+            if game_key not in wanted or not event.get('scores'):
+                continue
+            points = {score['name']: int(score['score']) for score in event['scores']}
+            scores[game_key] = {
+                'home_score': points.get(event['home_team']),
+                'away_score': points.get(event['away_team']),
+                'final': bool(event.get('completed'))
+            }
+        return scores
+
+class FileScoreProvider(ScoreProvider):
+    """Scores from a local JSON file keyed like picks.json ("2025-1"), for offline testing."""
+    def __init__(self, path):
+        self.path = path
     
-    elif pick.category == "Favorite":
-        # Check if the favorite covered the spread
-        if game.get('spread_winner') == pick_value:
-            return "win"
-        else:
-            return "loss"
+    def fetch_scores(self, week, season, games):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r') as f:
+            week_scores = json.load(f).get(f"{season}-{week}", {})
+        wanted = {f"{game.away_team} @ {game.home_team}" for game in games}
+        return {key: value for key, value in week_scores.items() if key in wanted}
     
-    elif pick.category == "Underdog":
-        # Check if the underdog covered the spread
-        if game.get('spread_winner') == pick_value:
-            return "win"
+    def fetch_touchdowns(self, week, season, games):
+        scores = self.fetch_scores(week, season, games)
+        return {key: value['touchdowns'] for key, value in scores.items() if 'touchdowns' in value}
+
+score_providers = {}
+
+def get_score_provider(name=None):
+    name = name or app.config['SCORE_PROVIDER']
+    if name not in score_providers:
+        if name == 'file':
+            score_providers[name] = FileScoreProvider(app.config['SCORES_FILE'])
+        elif name == 'odds-api':
+            score_providers[name] = OddsApiScoreProvider(ODDS_API_KEY)
         else:
-            return "loss"
+            raise ValueError(f"Unknown score provider: {name}")
+    return score_providers[name]
+
+def fetch_touchdown_scorers(week, season):
+    """
+    Store touchdown scorers for the week's final games that have none loaded
+    yet, leaving the commit to the caller.
+    """
+    pending = db.session.query(Game, GameResult).join(GameResult, GameResult.game_id == Game.id).filter(
+        Game.week == week,
+        Game.season == season,
+        GameResult.final.is_(True),
+        db.or_(GameResult.touchdowns_loaded.is_(None), GameResult.touchdowns_loaded.is_(False))
+    ).all()
+    if not pending:
+        return
     
-    elif pick.category == "Over":
-        # Check if total points exceeded the over/under line
-        if game.get('total_result') == "over":
-            return "win"
-        else:
-            return "loss"
+    try:
+        touchdowns = get_score_provider(app.config['TOUCHDOWN_PROVIDER']).fetch_touchdowns(
+            week, season, [game for game, _ in pending]
+        )
+    except requests.RequestException as e:
+        print(f"Error fetching touchdown scorers for week {week}: {e}")
+        return
     
-    elif pick.category == "Under":
-        # Check if total points were under the over/under line
-        if game.get('total_result') == "under":
-            return "win"
-        else:
-            return "loss"
+    rows = []
+    for game, result in pending:
+        scorers = touchdowns.get(f"{game.away_team} @ {game.home_team}")
+        if scorers is None:
+            continue
+        rows.extend({'game_id': game.id, 'name': scorer['name'], 'team': scorer['team']} for scorer in scorers)
+        result.touchdowns_loaded = True
+    if rows:
+        db.session.execute(sqlite_insert(TouchdownScorer).values(rows).on_conflict_do_nothing())
+
+def serialize_game_result(game, result):
+    moneyline_winner = None
+    # Providers can report a game final before both scores are in
+    scored = result.home_score is not None and result.away_score is not None
+    if result.final and scored and result.home_score != result.away_score:
+        moneyline_winner = game.home_team if result.home_score > result.away_score else game.away_team
+    return {
+        'home_score': result.home_score,
+        'away_score': result.away_score,
+        'final': result.final,
+        'moneyline_winner': moneyline_winner
+    }
+
+def fetch_game_results(week, season):
+    """
+    Scores for a week keyed "Away @ Home". Stored GameResult rows are used
+    as-is once final; only games that have kicked off and are not final are
+    asked of the score provider. New scores are written to the session for
+    the caller to commit.
+    """
+    games = Game.query.filter_by(week=week, season=season).all()
+    stored = {
+        result.game_id: result
+        for result in GameResult.query.filter(GameResult.game_id.in_([game.id for game in games]))
+    }
     
-    elif pick.category == "Touchdown Scorer":
-        # This would require player-specific touchdown data
-        # For now, return None (manual entry required)
-        return None
+    now = datetime.utcnow()
+    pending = [
+        game for game in games
+        if not (game.id in stored and stored[game.id].final)
+        and parse_commence_time(game.commence_time) <= now
+    ]
+    if pending:
+        try:
+            scores = get_score_provider().fetch_scores(week, season, pending)
+        except requests.RequestException as e:
+            print(f"Error fetching scores for week {week}: {e}")
+            scores = {}
+        
+        for game in pending:
+            score = scores.get(f"{game.away_team} @ {game.home_team}")
+            if not score:
+                continue
+            result = stored.get(game.id)
+            if not result:
+                result = stored[game.id] = GameResult(game_id=game.id)
+                db.session.add(result)
+            result.home_score = score.get('home_score')
+            result.away_score = score.get('away_score')
+            result.final = bool(score.get('final'))
+            result.updated_at = now
     
-    return None
+    return {
+        f"{game.away_team} @ {game.home_team}": serialize_game_result(game, stored[game.id])
+        for game in games if game.id in stored
+    }
 
 @app.route('/api/game-results/<int:week>')
 def get_game_results(week):
     """
     API endpoint to fetch game results for a specific week.
-    This would integrate with a real sports API.
     """
     season = 2025
     
     # Get games for the week
     games = Game.query.filter_by(week=week, season=season).all()
     
-    # Fetch results from external API
+    # Fetch results from the score provider, caching new scores
     results = fetch_game_results(week, season)
-    
-    # Format response
+    db.session.commit()
+    return jsonify(format_game_results(games, results))
+
+def format_game_results(games, results):
+    """
+    One entry per game, with scores from results (keyed "Away @ Home") where
+    known. Spread and total outcomes depend on the line each pick was taken
+    at, so they are settled per pick (see settle_line_picks), not here.
+    """
     formatted_results = []
     for game in games:
         game_key = f"{game.away_team} @ {game.home_team}"
@@ -753,15 +2448,237 @@ def get_game_results(week):
             'home_score': game_result.get('home_score'),
             'away_score': game_result.get('away_score'),
             'final': game_result.get('final', False),
-            'spread': game_result.get('spread'),
-            'total': game_result.get('total'),
-            'moneyline_winner': game_result.get('moneyline_winner'),
-            'spread_winner': game_result.get('spread_winner'),
-            'total_result': game_result.get('total_result')
+            'moneyline_winner': game_result.get('moneyline_winner')
         })
+    return formatted_results
+
+@app.route('/api/week/<int:week>')
+def get_week_bootstrap(week):
+    """
+    Everything the picks page needs for a week in one response: games with
+    PICK_LINE_BOOKMAKER odds only, picks, lock status, graded results, the
+    stored scores and touchdown scorer options. Scores come from the
+    GameResult cache; fresh ones arrive over /api/live.
+    """
+    season = 2025
+    entry = load_week_games(week, season, (app.config['PICK_LINE_BOOKMAKER'],), ('h2h', 'spreads', 'totals'))
+    games = week_game_rows(week, season)
+    stored = {
+        result.game_id: result
+        for result in db.session.execute(db.select(
+            GameResult.game_id, GameResult.home_score, GameResult.away_score, GameResult.final
+        ).where(GameResult.game_id.in_([game.id for game in games])))
+    }
+    scores = {
+        f"{game.away_team} @ {game.home_team}": serialize_game_result(game, stored[game.id])
+        for game in games if game.id in stored
+    }
+    teams = sorted({TEAM_ABBREVIATIONS.get(team) for game in games for team in (game.home_team, game.away_team)} - {None})
+    
+    return jsonify({
+        'week': week,
+        'games': entry['games'] if entry else [],
+        'picks': week_picks(week, season),
+        'lock': week_lock_status(week, season),
+        'results': week_results(week, season),
+        'scores': format_game_results(games, scores),
+        'touchdown_options': starters_for_teams(teams) if teams else [],
+        'live': week_in_progress(week, season)
+    })
+
+def week_in_progress(week, season, now=None):
+    """True while any of the week's games has kicked off and is not final."""
+    now = now or datetime.utcnow()
+    window = timedelta(hours=app.config['LIVE_GAME_HOURS'])
+    games = db.session.query(Game.commence_time, GameResult.final).outerjoin(
+        GameResult, GameResult.game_id == Game.id
+    ).filter(Game.week == week, Game.season == season)
+    for commence_time, final in games:
+        kickoff = parse_commence_time(commence_time)
+        if not final and kickoff <= now < kickoff + window:
+            return True
+    return False
+
+class LiveFeed:
+    """
+    Fans score and provisional pick-outcome changes out to clients. One
+    background thread per process polls the score provider for every week
+    that has streaming subscribers and pushes only what changed; it exits
+    when the last stream closes. Streams are capped at LIVE_MAX_STREAMS per
+    process, and clients turned away call snapshot() instead, which reuses
+    the last poll while it is fresher than LIVE_POLL_INTERVAL.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # week -> set of client queues
+        self._state = {}        # week -> {'scores', 'outcomes', 'live', 'polled_at'}
+        self._refreshes = SingleFlight()
+        self._thread = None
+    
+    def subscribe(self, week):
+        """
+        Register a client queue, primed with the week's last known state.
+        Returns None if this process already serves LIVE_MAX_STREAMS streams.
+        """
+        client = queue.Queue()
+        with self._lock:
+            if sum(len(clients) for clients in self._subscribers.values()) >= app.config['LIVE_MAX_STREAMS']:
+                return None
+            self._subscribers.setdefault(week, set()).add(client)
+            state = self._state.get(week)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        if state:
+            for data in state['scores'].values():
+                client.put(('score', data))
+            for data in state['outcomes'].values():
+                client.put(('outcome', data))
+        return client
+    
+    def unsubscribe(self, week, client):
+        with self._lock:
+            clients = self._subscribers.get(week, set())
+            clients.discard(client)
+            if not clients:
+                self._subscribers.pop(week, None)
+                self._state.pop(week, None)
+    
+    def snapshot(self, week):
+        """The week's current state for polling clients, polled at most once per LIVE_POLL_INTERVAL."""
+        with self._lock:
+            state = self._state.get(week)
+        if not state or time.monotonic() - state['polled_at'] >= app.config['LIVE_POLL_INTERVAL']:
+            state = self._refreshes.do(week, lambda: self._refresh(week))
+        return state
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                weeks = list(self._subscribers)
+                if not weeks:
+                    self._thread = None
+                    return
+            
+            for week in weeks:
+                with app.app_context():
+                    try:
+                        self._refreshes.do(week, lambda: self._refresh(week))
+                    except Exception as e:
+                        db.session.rollback()
+                        print(f"Error polling live scores for week {week}: {e}")
+            
+            time.sleep(app.config['LIVE_POLL_INTERVAL'])
+    
+    def _refresh(self, week):
+        """Poll the week, push what changed to its streams and return the new state."""
+        state = self._poll(week)
+        with self._lock:
+            previous = self._state.get(week, {'scores': {}, 'outcomes': {}})
+            self._state[week] = state
+            clients = list(self._subscribers.get(week, ()))
+        
+        events = [('score', data) for key, data in state['scores'].items() if previous['scores'].get(key) != data]
+        events += [('outcome', data) for key, data in state['outcomes'].items() if previous['outcomes'].get(key) != data]
+        if not state['live']:
+            # Nothing left to stream; clients close rather than hold a thread
+            events.append(('end', {}))
+        for event in events:
+            for client in clients:
+                client.put(event)
+        return state
     
-    return jsonify(formatted_results)
+    def _poll(self, week):
+        """Refresh the week's scores and return its scores, provisional outcomes and whether it is in progress."""
+        season = 2025
+        results = fetch_game_results(week, season)
+        db.session.commit()
+        
+        games = Game.query.filter_by(week=week, season=season).all()
+        scores = {}
+        for game in games:
+            game_key = f"{game.away_team} @ {game.home_team}"
+            if game_key in results:
+                scores[game.id] = {'game_id': game.id, 'game': game_key, **results[game_key]}
+        
+        final_games = {game_id for game_id, score in scores.items() if score['final']}
+        pick_games = dict(db.session.query(Pick.id, Pick.game_id).filter_by(week=week, season=season))
+        player_names = dict(db.session.query(Player.id, Player.name))
+        outcomes = {}
+        for row in settle_line_picks(season, [week], final_only=False):
+            outcomes[(row['player_id'], row['category'])] = {
+                'player': player_names.get(row['player_id']),
+                'category': row['category'],
+                'outcome': row['outcome'],
+                'provisional': pick_games.get(row['pick_id']) not in final_games
+            }
+        
+        return {
+            'scores': scores,
+            'outcomes': outcomes,
+            'live': week_in_progress(week, season),
+            'polled_at': time.monotonic()
+        }
+
+live_feed = LiveFeed()
+
+@app.route('/api/live')
+def live_stream():
+    """
+    Server-Sent Events stream of score and provisional outcome changes for a
+    week (default: the current week). Sends a keepalive comment when idle
+    and an "end" event, then closes, once none of the week's games is in
+    progress. Responds 204 if none is in progress to begin with, and 503 if
+    this process is at LIVE_MAX_STREAMS; clients then poll /api/live/<week>.
+    """
+    week = request.args.get('week', type=int) or current_nfl_week()
+    if not week_in_progress(week, 2025):
+        return '', 204
+    client = live_feed.subscribe(week)
+    if client is None:
+        response = jsonify({'error': f'Too many live streams, poll /api/live/{week}'})
+        response.status_code = 503
+        response.retry_after = app.config['LIVE_POLL_INTERVAL']
+        return response
+    
+    def stream():
+        try:
+            while True:
+                try:
+                    event, data = client.get(timeout=15)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+                if event == 'end':
+                    return
+        finally:
+            live_feed.unsubscribe(week, client)
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/live/<int:week>')
+def live_snapshot(week):
+    """
+    Polling fallback for /api/live: the week's scores and provisional
+    outcomes, whether its games are still in progress, and how many seconds
+    to wait before polling again.
+    """
+    if not week_in_progress(week, 2025):
+        return jsonify({'live': False, 'scores': [], 'outcomes': [], 'poll_interval': None})
+    state = live_feed.snapshot(week)
+    return jsonify({
+        'live': state['live'],
+        'scores': list(state['scores'].values()),
+        'outcomes': list(state['outcomes'].values()),
+        'poll_interval': app.config['LIVE_POLL_INTERVAL']
+    })
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    with app.app_context():
+        init_database()
+    app.run(debug=os.getenv('FLASK_DEBUG', '1') == '1')
     
\ No newline at end of file
@@ -0,0 +1,24 @@
+# Production server settings: gunicorn -c gunicorn.conf.py app:app
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:8000')
+workers = int(os.getenv('WEB_CONCURRENCY', 4))
+# Threaded workers. Each open /api/live stream still holds one thread, so the
+# app caps streams at LIVE_MAX_STREAMS per worker (default 2 of WEB_THREADS)
+# and sends further clients to the polling endpoint
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', 8))
+timeout = int(os.getenv('WEB_TIMEOUT', 30))
+# Import the app once in the master and fork workers from it
+preload_app = True
+accesslog = '-'
+
+
+def on_starting(server):
+    # Migrate and seed once, in the master, before any worker starts, rather
+    # than in every worker at the same time. Pooled connections are dropped
+    # afterwards so workers open their own.
+    from app import app, db, init_database
+    with app.app_context():
+        init_database()
+        db.engine.dispose()
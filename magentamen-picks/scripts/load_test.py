@@ -0,0 +1,116 @@
+"""
+Concurrent read/write load test against a running server.
+
+Reader threads GET /api/picks while writer threads POST /api/results for
+--duration seconds, then read latency percentiles are printed. With
+--heavy-writes DB_PATH, a separate process also commits large insert/delete
+transactions to the SQLite file, --heavy-pause seconds apart, to show whether
+reads stall behind writers. SQLite's lock isn't fair, so back-to-back heavy
+transactions with no pause starve the app's own writes.
+Writes go to week 1 results, so point it at a copy of the database.
+"""
+import argparse
+import multiprocessing
+import sqlite3
+import threading
+import time
+
+import requests
+
+PLAYERS = ["Jaren", "JB", "Rory", "Zach"]
+
+
+def read_picks(url, week, stop, latencies, errors):
+    session = requests.Session()
+    while time.time() < stop:
+        started = time.perf_counter()
+        response = session.get(f"{url}/api/picks", params={'week': week})
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors.append(f"GET {response.status_code}")
+
+
+def write_results(url, week, player, stop, writes, errors):
+    session = requests.Session()
+    i = 0
+    while time.time() < stop:
+        response = session.post(f"{url}/api/results", json={
+            'week': week,
+            'player': player,
+            'category': 'Moneyline',
+            'outcome': ('win', 'loss')[i % 2]
+        })
+        i += 1
+        if response.status_code == 200:
+            writes.append(1)
+        else:
+            errors.append(f"POST {response.status_code}: {response.text[:100]}")
+
+
+def heavy_writes(db_path, stop, rows, pause):
+    """Commit rows-sized insert/delete transactions to a scratch table until stop."""
+    connection = sqlite3.connect(db_path, timeout=30)
+    connection.execute('CREATE TABLE IF NOT EXISTS load_test_rows (id INTEGER PRIMARY KEY, value TEXT)')
+    transactions = 0
+    while time.time() < stop:
+        connection.execute('BEGIN IMMEDIATE')
+        connection.executemany('INSERT INTO load_test_rows (value) VALUES (?)', [(str(i),) for i in range(rows)])
+        connection.execute('DELETE FROM load_test_rows')
+        connection.commit()
+        transactions += 1
+        time.sleep(pause)
+    connection.execute('DROP TABLE load_test_rows')
+    connection.close()
+    print(f"heavy writer: {transactions} transactions of {rows} rows")
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--week', type=int, default=1)
+    parser.add_argument('--duration', type=int, default=15, help='seconds to run')
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--heavy-writes', metavar='DB_PATH', help='also write to this SQLite file directly')
+    parser.add_argument('--heavy-rows', type=int, default=100000, help='rows per heavy write transaction')
+    parser.add_argument('--heavy-pause', type=float, default=0.25, help='seconds between heavy write transactions')
+    args = parser.parse_args()
+    
+    stop = time.time() + args.duration
+    latencies, writes, errors = [], [], []
+    threads = [
+        threading.Thread(target=read_picks, args=(args.url, args.week, stop, latencies, errors))
+        for _ in range(args.readers)
+    ] + [
+        threading.Thread(target=write_results, args=(args.url, args.week, PLAYERS[i % len(PLAYERS)], stop, writes, errors))
+        for i in range(args.writers)
+    ]
+    writer = None
+    if args.heavy_writes:
+        writer = multiprocessing.Process(target=heavy_writes, args=(args.heavy_writes, stop, args.heavy_rows, args.heavy_pause))
+        writer.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if writer:
+        writer.join()
+    
+    latencies.sort()
+    if not latencies:
+        print("no reads completed")
+        return
+    print(f"reads: {len(latencies)}, writes: {len(writes)}, errors: {len(errors)}")
+    print("read latency: p50 {:.0f}ms, p99 {:.0f}ms, max {:.0f}ms".format(
+        percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000, latencies[-1] * 1000
+    ))
+    for error in errors[:5]:
+        print(error)
+
+
+if __name__ == '__main__':
+    main()
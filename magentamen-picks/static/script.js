@@ -8,6 +8,10 @@ const CATEGORIES = ["Moneyline", "Favorite", "Underdog", "Over", "Under", "Touch
 let currentWeekLocked = false;
 let picksMode = true; // true = picks, false = results
 let gameResults = {}; // Store game results for automatic outcome calculation
+let liveOutcomes = {}; // "player|category" -> outcome pushed by the live feed
+let liveFeed = null; // EventSource while the selected week has games in progress
+let livePoll = null; // Polling timer used instead when the server has no stream free
+let liveWeek = null;
 
 function getCurrentNFLWeek() {
     // NFL 2025 Week 1 starts Sep 4, 2025
@@ -20,31 +24,22 @@ function getCurrentNFLWeek() {
     return week;
 }
 
-async function checkWeekLockStatus(week) {
-    try {
-        const response = await fetch(`/api/week/lock/${week}`);
-        const data = await response.json();
-        currentWeekLocked = data.locked;
-        
-        const lockBtn = document.getElementById('lock-week-btn');
-        const lockBtnText = document.getElementById('lock-btn-text');
-        
-        if (data.locked) {
-            lockBtn.classList.remove('bg-red-600', 'hover:bg-red-700');
-            lockBtn.classList.add('bg-gray-600', 'cursor-not-allowed');
-            lockBtn.disabled = true;
-            lockBtnText.textContent = `Locked (${new Date(data.locked_at).toLocaleDateString()})`;
-        } else {
-            lockBtn.classList.remove('bg-gray-600', 'cursor-not-allowed');
-            lockBtn.classList.add('bg-red-600', 'hover:bg-red-700');
-            lockBtn.disabled = false;
-            lockBtnText.textContent = 'Lock Week';
-        }
-        
-        return data.locked;
-    } catch (error) {
-        console.error('Error checking lock status:', error);
-        return false;
+function applyLockStatus(data) {
+    currentWeekLocked = data.locked;
+    
+    const lockBtn = document.getElementById('lock-week-btn');
+    const lockBtnText = document.getElementById('lock-btn-text');
+    
+    if (data.locked) {
+        lockBtn.classList.remove('bg-red-600', 'hover:bg-red-700');
+        lockBtn.classList.add('bg-gray-600', 'cursor-not-allowed');
+        lockBtn.disabled = true;
+        lockBtnText.textContent = `Locked (${new Date(data.locked_at).toLocaleDateString()})`;
+    } else {
+        lockBtn.classList.remove('bg-gray-600', 'cursor-not-allowed');
+        lockBtn.classList.add('bg-red-600', 'hover:bg-red-700');
+        lockBtn.disabled = false;
+        lockBtnText.textContent = 'Lock Week';
     }
 }
 
@@ -72,7 +67,6 @@ async function lockWeek(week) {
         
         if (response.ok) {
             alert('Week locked successfully!');
-            await checkWeekLockStatus(week);
             renderPicksTableWithOptions(); // Re-render to disable dropdowns
         } else {
             alert(data.error || 'Error locking week');
@@ -94,75 +88,119 @@ function populateWeekSelector() {
     weekSelector.value = getCurrentNFLWeek();
 }
 
-function fetchGamesForWeek(week) {
+function showGamesLoading() {
     gamesList.innerHTML = '<div class="p-8 text-center"><div class="space-y-4"><div class="shimmer h-8 rounded"></div><div class="shimmer h-6 rounded"></div><div class="shimmer h-6 rounded"></div></div></div>';
-    
-    fetch(`/api/games?week=${week}`)
-        .then(response => {
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-            return response.json();
-        })
-        .then(data => {
-            if (Array.isArray(data) && data.length > 0) {
-                gamesList.innerHTML = '';
-                data.forEach(game => {
-                    const home = game.home_team;
-                    const away = game.away_team;
-                    const commence = new Date(game.commence_time).toLocaleString();
-                    const div = document.createElement('div');
-                    div.className = 'bg-white rounded-lg shadow-lg p-6 transform hover:scale-105 transition';
-                    div.innerHTML = `
-                        <div class="text-center">
-                            <div class="text-lg font-bold text-gray-900 mb-2">${away} @ ${home}</div>
-                            <div class="text-sm text-gray-600">${commence}</div>
-                            <div class="mt-3 flex justify-center space-x-2">
-                                <span class="px-2 py-1 bg-purple-100 text-purple-800 rounded text-xs">${away}</span>
-                                <span class="px-2 py-1 bg-purple-100 text-purple-800 rounded text-xs">${home}</span>
-                            </div>
-                        </div>
-                    `;
-                    gamesList.appendChild(div);
-                });
-            } else {
-                gamesList.innerHTML = '<div class="col-span-full text-center py-8"><p class="text-gray-500">No games found for this week.</p></div>';
-            }
-        })
-        .catch(err => {
-            console.error('Error loading games:', err);
-            gamesList.innerHTML = '<div class="col-span-full text-center py-8"><p class="text-red-500">Error loading games. Please try again.</p></div>';
+}
+
+function renderGamesList(data) {
+    if (Array.isArray(data) && data.length > 0) {
+        gamesList.innerHTML = '';
+        data.forEach(game => {
+            const home = game.home_team;
+            const away = game.away_team;
+            const commence = new Date(game.commence_time).toLocaleString();
+            const div = document.createElement('div');
+            div.className = 'bg-white rounded-lg shadow-lg p-6 transform hover:scale-105 transition';
+            div.innerHTML = `
+                <div class="text-center">
+                    <div class="text-lg font-bold text-gray-900 mb-2">${away} @ ${home}</div>
+                    <div class="text-sm text-gray-600">${commence}</div>
+                    <div class="mt-3 flex justify-center space-x-2">
+                        <span class="px-2 py-1 bg-purple-100 text-purple-800 rounded text-xs">${away}</span>
+                        <span class="px-2 py-1 bg-purple-100 text-purple-800 rounded text-xs">${home}</span>
+                    </div>
+                </div>
+            `;
+            gamesList.appendChild(div);
         });
+    } else {
+        gamesList.innerHTML = '<div class="col-span-full text-center py-8"><p class="text-gray-500">No games found for this week.</p></div>';
+    }
 }
 
-async function fetchGameResults(week) {
-    try {
-        const response = await fetch(`/api/game-results/${week}`);
-        if (response.ok) {
-            const results = await response.json();
-            gameResults = {};
-            results.forEach(game => {
-                const gameKey = `${game.away_team} @ ${game.home_team}`;
-                gameResults[gameKey] = game;
-            });
-        } else {
-            console.warn('Failed to fetch game results, using empty results');
-            gameResults = {};
-        }
-    } catch (error) {
-        console.error('Error fetching game results:', error);
-        gameResults = {};
+function setGameResults(results) {
+    gameResults = {};
+    results.forEach(game => {
+        const gameKey = `${game.away_team} @ ${game.home_team}`;
+        gameResults[gameKey] = game;
+    });
+}
+
+function outcomeClassFor(outcome) {
+    if (outcome === 'win' || outcome === 'loss' || outcome === 'tie') return `result-${outcome}`;
+    return 'result-pending';
+}
+
+function updateOutcomeCell(player, category, outcome) {
+    const cell = document.querySelector(`.pick-outcome[data-player="${player}"][data-category="${category}"]`);
+    if (!cell) return;
+    cell.classList.remove('result-win', 'result-loss', 'result-tie', 'result-pending');
+    cell.classList.add(outcomeClassFor(outcome));
+    const label = cell.querySelector('.outcome-label');
+    if (label) label.textContent = outcome || 'pending';
+}
+
+function applyLiveScore(score) {
+    gameResults[score.game] = score;
+}
+
+function applyLiveOutcome({ player, category, outcome }) {
+    liveOutcomes[`${player}|${category}`] = outcome;
+    updateOutcomeCell(player, category, outcome);
+}
+
+function closeLiveFeed() {
+    if (liveFeed) liveFeed.close();
+    clearTimeout(livePoll);
+    liveFeed = null;
+    livePoll = null;
+    liveWeek = null;
+}
+
+function subscribeLiveFeed(week) {
+    // One stream for the selected week while its games are in progress; scores
+    // and provisional outcomes arrive as they change until the server sends "end"
+    closeLiveFeed();
+    liveWeek = week;
+    if (!window.EventSource) {
+        pollLiveFeed(week);
+        return;
     }
+    
+    liveFeed = new EventSource(`/api/live?week=${week}`);
+    liveFeed.addEventListener('score', event => applyLiveScore(JSON.parse(event.data)));
+    liveFeed.addEventListener('outcome', event => applyLiveOutcome(JSON.parse(event.data)));
+    liveFeed.addEventListener('end', closeLiveFeed);
+    liveFeed.onerror = () => {
+        // A refused stream (server at capacity) closes for good; poll instead.
+        // Dropped connections stay CONNECTING and reconnect on their own.
+        if (liveFeed && liveFeed.readyState === EventSource.CLOSED) {
+            liveFeed = null;
+            pollLiveFeed(week);
+        }
+    };
 }
 
-async function fetchPicksForWeek(week) {
+async function pollLiveFeed(week) {
+    let delay = 60;
     try {
-        const res = await fetch(`/api/picks?week=${week}`);
-        return res.ok ? await res.json() : {};
+        const response = await fetch(`/api/live/${week}`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        const data = await response.json();
+        if (liveWeek !== week) return;
+        data.scores.forEach(applyLiveScore);
+        data.outcomes.forEach(applyLiveOutcome);
+        if (!data.live) {
+            closeLiveFeed();
+            return;
+        }
+        delay = data.poll_interval;
     } catch (error) {
-        console.error('Error fetching picks:', error);
-        return {};
+        console.error('Error polling live scores:', error);
     }
+    if (liveWeek === week) livePoll = setTimeout(() => pollLiveFeed(week), delay * 1000);
 }
 
 function getFanDuelBookmaker(game) {
@@ -247,137 +285,57 @@ function getOverUnderOptions(games) {
     };
 }
 
-async function getTouchdownScorerOptions(games) {
-    try {
-        const abbrs = new Set();
-        if (!Array.isArray(games)) return [];
-        
-        games.forEach(game => {
-            // Extract team abbreviations from team names
-            const homeTeam = game.home_team;
-            const awayTeam = game.away_team;
-            
-            // Map full team names to abbreviations
-            const teamMap = {
-                "Kansas City Chiefs": "KC",
-                "Baltimore Ravens": "BAL",
-                "Buffalo Bills": "BUF",
-                "New York Jets": "NYJ",
-                "Dallas Cowboys": "DAL",
-                "Philadelphia Eagles": "PHI",
-                "Miami Dolphins": "MIA",
-                "New England Patriots": "NE",
-                "Cincinnati Bengals": "CIN",
-                "Cleveland Browns": "CLE",
-                "Pittsburgh Steelers": "PIT",
-                "Houston Texans": "HOU",
-                "Indianapolis Colts": "IND",
-                "Jacksonville Jaguars": "JAX",
-                "Tennessee Titans": "TEN",
-                "Denver Broncos": "DEN",
-                "Las Vegas Raiders": "LV",
-                "Los Angeles Chargers": "LAC",
-                "Los Angeles Rams": "LAR",
-                "San Francisco 49ers": "SF",
-                "Seattle Seahawks": "SEA",
-                "Arizona Cardinals": "ARI",
-                "Detroit Lions": "DET",
-                "Green Bay Packers": "GB",
-                "Minnesota Vikings": "MIN",
-                "Chicago Bears": "CHI",
-                "New Orleans Saints": "NO",
-                "Tampa Bay Buccaneers": "TB",
-                "Atlanta Falcons": "ATL",
-                "Carolina Panthers": "CAR",
-                "New York Giants": "NYG",
-                "Washington Commanders": "WAS"
-            };
-            
-            if (teamMap[homeTeam]) abbrs.add(teamMap[homeTeam]);
-            if (teamMap[awayTeam]) abbrs.add(teamMap[awayTeam]);
-        });
-        
-        const abbrList = Array.from(abbrs);
-        if (abbrList.length === 0) return [];
-        
-        const res = await fetch(`/api/starters?teams=${abbrList.join(',')}`);
-        if (!res.ok) return [];
-        const players = await res.json();
-        
-        return players.map(p => ({
-            label: `${p.name} (${p.team}) - ${p.pos}`,
-            value: `${p.name} (${p.team})`
-        }));
-    } catch (error) {
-        console.error('Error fetching touchdown scorer options:', error);
-        return [];
-    }
+function getTouchdownScorerOptions(players) {
+    return players.map(p => ({
+        label: `${p.name} (${p.team}) - ${p.pos}`,
+        value: `${p.name} (${p.team})`
+    }));
 }
 
 async function savePick(player, category, value, week) {
     if (!value) return;
-    
+    const saved = await savePicks({ [player]: { [category]: value } }, week);
+    return saved !== null;
+}
+
+// Submit { player: { category: value } } in one request; returns the saved count or null
+async function savePicks(picks, week) {
     try {
-        const response = await fetch('/api/picks', {
+        const response = await fetch('/api/picks/batch', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                week: week,
-                player: player,
-                category: category,
-                value: value
-            })
+            body: JSON.stringify({ week: week, picks: picks })
         });
         
         const result = await response.json();
         
         if (!response.ok) {
-            alert(result.error || 'Error saving pick');
-            return false;
+            const details = result.errors ? `\n${result.errors.join('\n')}` : '';
+            alert((result.error || 'Error saving picks') + details);
+            return null;
         }
         
-        return true;
+        return result.saved;
     } catch (error) {
-        console.error('Error saving pick:', error);
-        alert('Error saving pick');
-        return false;
+        console.error('Error saving picks:', error);
+        alert('Error saving picks');
+        return null;
     }
 }
 
 function calculatePickOutcome(pick, games) {
     if (!pick || !pick.value || !gameResults) return null;
     
-    // Find the game this pick relates to
-    let gameResult = null;
+    // Graded or live outcomes, settled on the server against the pick's own line
+    const live = liveOutcomes[`${pick.player}|${pick.category}`];
+    if (live) return live;
+    
+    // Spread and total picks need that line, so only Moneyline is settled here
+    if (pick.category !== "Moneyline") return null;
     for (const [gameKey, result] of Object.entries(gameResults)) {
-        if (result.final) {
-            // Check if this pick relates to this game
-            if (pick.category === "Moneyline") {
-                if (pick.value === result.moneyline_winner) {
-                    return "win";
-                } else if (result.moneyline_winner) {
-                    return "loss";
-                }
-            } else if (pick.category === "Favorite" || pick.category === "Underdog") {
-                if (pick.value === result.spread_winner) {
-                    return "win";
-                } else if (result.spread_winner) {
-                    return "loss";
-                }
-            } else if (pick.category === "Over") {
-                if (result.total_result === "over") {
-                    return "win";
-                } else if (result.total_result === "under") {
-                    return "loss";
-                }
-            } else if (pick.category === "Under") {
-                if (result.total_result === "under") {
-                    return "win";
-                } else if (result.total_result === "over") {
-                    return "loss";
-                }
-            }
-        }
+        if (!result.final || !gameKey.split(' @ ').includes(pick.value)) continue;
+        if (!result.moneyline_winner) return "tie";
+        return pick.value === result.moneyline_winner ? "win" : "loss";
     }
     
     return null; // No result available or game not final
@@ -401,50 +359,32 @@ async function renderPicksTableWithOptions() {
             </div>
         `;
 
-        // Fetch data sequentially to avoid race conditions
-        let gamesData = [];
-        let picksData = {};
-        
-        try {
-            // Fetch games
-            const gamesResponse = await fetch(`/api/games?week=${week}`);
-            if (gamesResponse.ok) {
-                gamesData = await gamesResponse.json();
-            } else {
-                console.warn('Failed to fetch games, using empty array');
-            }
-        } catch (error) {
-            console.warn('Error fetching games:', error);
-        }
-
-        try {
-            // Fetch picks
-            picksData = await fetchPicksForWeek(week);
-        } catch (error) {
-            console.warn('Error fetching picks:', error);
+        // Games, picks, lock status, results and touchdown options in one request
+        const response = await fetch(`/api/week/${week}`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
         }
-
-        // Fetch game results in background (non-blocking)
-        fetchGameResults(week).catch(err => console.warn('Game results fetch failed:', err));
+        const data = await response.json();
+        const gamesData = data.games;
+        const picksData = data.picks;
+        
+        applyLockStatus(data.lock);
+        renderGamesList(gamesData);
+        setGameResults(data.scores);
+        Object.entries(data.results).forEach(([player, cats]) => {
+            Object.entries(cats).forEach(([cat, result]) => {
+                const key = `${player}|${cat}`;
+                if (!liveOutcomes[key]) liveOutcomes[key] = result.outcome;
+            });
+        });
+        // Stream scores only while the week has games in progress
+        if (data.live && liveWeek !== week) subscribeLiveFeed(week);
 
         // Generate options
         const moneylineOptions = getMoneylineOptions(gamesData);
         const { favorites, underdogs } = getFavoriteUnderdogOptions(gamesData);
         const { overs, unders } = getOverUnderOptions(gamesData);
-        
-        // Fetch touchdown scorer options (with fallback)
-        let tdOptions = [];
-        try {
-            tdOptions = await getTouchdownScorerOptions(gamesData);
-        } catch (error) {
-            console.warn('Failed to fetch touchdown scorer options:', error);
-            // Provide some fallback options
-            tdOptions = [
-                { label: "Patrick Mahomes (KC) - QB", value: "Patrick Mahomes (KC)" },
-                { label: "Josh Allen (BUF) - QB", value: "Josh Allen (BUF)" },
-                { label: "Lamar Jackson (BAL) - QB", value: "Lamar Jackson (BAL)" }
-            ];
-        }
+        const tdOptions = getTouchdownScorerOptions(data.touchdown_options);
 
         let html = '<table class="w-full"><thead class="bg-gradient-to-r from-purple-600 to-purple-700 text-white"><tr><th class="px-6 py-4 text-left text-sm font-medium uppercase tracking-wider">Player</th>';
         CATEGORIES.forEach(cat => {
@@ -478,7 +418,7 @@ async function renderPicksTableWithOptions() {
                 if (!picksMode) {
                     // Results mode: show color-coded outcome with automatic calculation
                     const pickValue = currentPick || '';
-                    const outcome = calculatePickOutcome({ value: pickValue, category: cat }, gamesData);
+                    const outcome = calculatePickOutcome({ player, value: pickValue, category: cat }, gamesData);
                     let outcomeClass = '';
                     let outcomeText = 'pending';
                     
@@ -496,13 +436,13 @@ async function renderPicksTableWithOptions() {
                         outcomeText = 'pending';
                     }
 
-                    html += `<div class="${outcomeClass} rounded-lg p-3">`;
+                    html += `<div class="${outcomeClass} rounded-lg p-3 pick-outcome" data-player="${player}" data-category="${cat}">`;
                     html += `<div class="pick-display">${pickValue || '<span class="text-gray-400">No Pick</span>'}</div>`;
-                    html += `<div class="text-xs uppercase">${outcomeText}</div>`;
+                    html += `<div class="text-xs uppercase outcome-label">${outcomeText}</div>`;
                     html += `</div>`;
                 } else if (currentWeekLocked) {
                     // Locked: show static pick with result color if available
-                    const outcome = calculatePickOutcome({ value: currentPick, category: cat }, gamesData);
+                    const outcome = calculatePickOutcome({ player, value: currentPick, category: cat }, gamesData);
                     let outcomeClass = '';
                     
                     if (outcome === 'win') {
@@ -515,19 +455,17 @@ async function renderPicksTableWithOptions() {
                         outcomeClass = 'result-pending';
                     }
 
-                    html += `<div class="${outcomeClass} rounded-lg p-3">`;
+                    html += `<div class="${outcomeClass} rounded-lg p-3 pick-outcome" data-player="${player}" data-category="${cat}">`;
                     if (currentPick) {
                         html += `<div class="pick-display">${currentPick}</div>`;
                     } else {
                         html += `<div class="pick-display text-gray-500">No Pick</div>`;
                     }
-                    if (outcome) {
-                        html += `<div class="text-xs uppercase">${outcome}</div>`;
-                    }
+                    html += `<div class="text-xs uppercase outcome-label">${outcome || ''}</div>`;
                     html += `</div>`;
                 } else {
                     // Editable dropdown with result preview
-                    const outcome = calculatePickOutcome({ value: currentPick, category: cat }, gamesData);
+                    const outcome = calculatePickOutcome({ player, value: currentPick, category: cat }, gamesData);
                     let dropdownClass = 'pick-dropdown';
                     if (outcome === 'win') dropdownClass += ' border-green-500 bg-green-50';
                     else if (outcome === 'loss') dropdownClass += ' border-red-500 bg-red-50';
@@ -592,16 +530,14 @@ async function renderPicksTableWithOptions() {
 // Event listeners
 document.addEventListener('DOMContentLoaded', function() {
     populateWeekSelector();
-    fetchGamesForWeek(weekSelector.value);
-    checkWeekLockStatus(weekSelector.value).then(() => {
-        renderPicksTableWithOptions();
-    });
+    showGamesLoading();
+    renderPicksTableWithOptions();
     
     weekSelector.addEventListener('change', function() {
-        fetchGamesForWeek(this.value);
-        checkWeekLockStatus(this.value).then(() => {
-            renderPicksTableWithOptions();
-        });
+        closeLiveFeed();
+        liveOutcomes = {};
+        showGamesLoading();
+        renderPicksTableWithOptions();
     });
     
     // Lock week button
@@ -611,25 +547,26 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // Save all button
     document.getElementById('save-all-btn').addEventListener('click', async function() {
-        const dropdowns = document.querySelectorAll('.pick-dropdown');
-        let savedCount = 0;
-        
-        for (const dropdown of dropdowns) {
+        const picks = {};
+        document.querySelectorAll('.pick-dropdown').forEach(dropdown => {
             if (dropdown.value) {
                 const player = dropdown.dataset.player;
-                const category = dropdown.dataset.category;
-                const value = dropdown.value;
-                const week = weekSelector.value;
-                
-                const success = await savePick(player, category, value, week);
-                if (success) savedCount++;
+                picks[player] = picks[player] || {};
+                picks[player][dropdown.dataset.category] = dropdown.value;
             }
+        });
+        
+        if (Object.keys(picks).length === 0) {
+            alert('No picks to save.');
+            return;
         }
         
+        const savedCount = await savePicks(picks, weekSelector.value);
+        if (savedCount === null) return;
         if (savedCount > 0) {
             alert(`Successfully saved ${savedCount} picks!`);
         } else {
-            alert('No picks to save.');
+            alert('No changes to save.');
         }
     });
     
@@ -0,0 +1,38 @@
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import event
+
+# Point the app at a throwaway database and keep it offline before importing it
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ['ODDS_API_KEY'] = ''
+
+from app import app as flask_app, db, upgrade_database
+
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        upgrade_database()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def queries(app):
+    """SQL statements executed while the test runs."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', record)
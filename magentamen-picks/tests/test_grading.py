@@ -0,0 +1,178 @@
+from datetime import datetime
+
+import pytest
+
+from app import (
+    db, Game, GameResult, OddsLine, Pick, Player, Result, Standing, TouchdownScorer,
+    settle_line_picks, settle_touchdown_picks, touchdown_name_cache
+)
+
+TOTAL = 'Dallas Cowboys @ Philadelphia Eagles'
+
+
+@pytest.fixture
+def game(app):
+    """A week 1 game, Cowboys at Eagles, with no score yet."""
+    game = Game(
+        week=1, season=2025, home_team='Philadelphia Eagles', away_team='Dallas Cowboys',
+        commence_time='2025-09-05T00:20:00Z'
+    )
+    db.session.add(game)
+    db.session.flush()
+    return game
+
+
+def add_score(game, home_score, away_score, final=True, touchdowns_loaded=True):
+    db.session.add(GameResult(
+        game_id=game.id, home_score=home_score, away_score=away_score, final=final,
+        updated_at=datetime.utcnow(), touchdowns_loaded=touchdowns_loaded
+    ))
+
+
+def add_pick(game, category, value, line=None, player='JB'):
+    player = Player.query.filter_by(name=player).first() or Player(name=player)
+    db.session.add(player)
+    db.session.flush()
+    pick = Pick(
+        week=game.week, season=game.season, player_id=player.id, category=category,
+        value=value, game_id=game.id, line=line
+    )
+    db.session.add(pick)
+    db.session.flush()
+    return pick
+
+
+def outcomes():
+    return [(row['category'], row['outcome']) for row in settle_line_picks(2025, [1])]
+
+
+@pytest.mark.parametrize('category, value, line, home_score, away_score, outcome', [
+    # Pushes on whole-number lines
+    ('Favorite', 'Philadelphia Eagles', -7, 27, 20, 'tie'),
+    ('Over', f'Over 47 ({TOTAL})', 47, 27, 20, 'tie'),
+    ('Under', f'Under 47 ({TOTAL})', 47, 27, 20, 'tie'),
+    # Favorites have to win by more than the spread
+    ('Favorite', 'Philadelphia Eagles', -6.5, 27, 20, 'win'),
+    ('Favorite', 'Philadelphia Eagles', -7.5, 27, 20, 'loss'),
+    # Underdogs cover by losing by less than the spread, or by winning
+    ('Underdog', 'Dallas Cowboys', 3.5, 23, 20, 'win'),
+    ('Underdog', 'Dallas Cowboys', 3.5, 17, 20, 'win'),
+    ('Underdog', 'Dallas Cowboys', 2.5, 23, 20, 'loss'),
+    ('Over', f'Over 46.5 ({TOTAL})', 46.5, 27, 20, 'win'),
+    ('Under', f'Under 46.5 ({TOTAL})', 46.5, 27, 20, 'loss'),
+    ('Moneyline', 'Dallas Cowboys', None, 20, 20, 'tie'),
+    ('Moneyline', 'Dallas Cowboys', None, 20, 27, 'win'),
+])
+def test_settles_line_picks(game, category, value, line, home_score, away_score, outcome):
+    add_pick(game, category, value, line)
+    add_score(game, home_score, away_score)
+    
+    assert outcomes() == [(category, outcome)]
+
+
+def test_spread_pick_without_a_stored_line_uses_the_current_spread(game):
+    add_pick(game, 'Favorite', 'Philadelphia Eagles')
+    db.session.add(OddsLine(
+        game_id=game.id, bookmaker='fanduel', market='spreads', outcome='Philadelphia Eagles',
+        price=-110, point=-7, fetched_at=datetime.utcnow()
+    ))
+    add_score(game, 27, 20)
+    
+    assert outcomes() == [('Favorite', 'tie')]
+
+
+def test_pick_without_a_line_is_left_out(game):
+    add_pick(game, 'Favorite', 'Philadelphia Eagles')
+    add_score(game, 27, 20)
+    
+    assert outcomes() == []
+
+
+def test_pick_without_a_final_score_is_left_out(game):
+    add_pick(game, 'Moneyline', 'Philadelphia Eagles')
+    assert outcomes() == []
+    
+    add_score(game, 14, 7, final=False)
+    assert outcomes() == []
+    assert [row['outcome'] for row in settle_line_picks(2025, [1], final_only=False)] == ['win']
+
+
+def graded_rows():
+    results = db.session.query(
+        Result.id, Result.week, Result.player_id, Result.category, Result.outcome, Result.pick_id
+    ).order_by(Result.id).all()
+    standings = db.session.query(
+        Standing.id, Standing.week, Standing.player_id, Standing.wins, Standing.losses, Standing.ties, Standing.total_picks
+    ).order_by(Standing.id).all()
+    return results, standings
+
+
+def grade(client):
+    response = client.post('/api/results/calculate', json={'week': 1})
+    assert response.status_code == 200
+    assert response.get_json()['message'] == 'Calculated 3 results for Week 1'
+
+
+def test_regrading_a_week_changes_nothing(client, game):
+    add_pick(game, 'Favorite', 'Philadelphia Eagles', -7, player='JB')
+    add_pick(game, 'Over', f'Over 44.5 ({TOTAL})', 44.5, player='JB')
+    add_pick(game, 'Moneyline', 'Dallas Cowboys', player='Rory')
+    add_score(game, 27, 20)
+    db.session.commit()
+    
+    grade(client)
+    first = graded_rows()
+    grade(client)
+    
+    assert graded_rows() == first
+    results, standings = first
+    assert sorted(outcome for *_, outcome, _ in results) == ['loss', 'tie', 'win']
+    assert sorted((wins, losses, ties, total) for *_, wins, losses, ties, total in standings) == [(0, 1, 0, 1), (1, 0, 1, 2)]
+
+
+@pytest.fixture
+def touchdowns(game):
+    """Saquon Barkley scored for the Eagles; the name cache starts empty."""
+    touchdown_name_cache.clear()
+    db.session.add(TouchdownScorer(game_id=game.id, name='Saquon Barkley', team='PHI'))
+    yield game
+    touchdown_name_cache.clear()
+
+
+@pytest.mark.parametrize('value, outcome', [
+    ('Saquon Barkley (PHI)', 'win'),
+    ('Saquan Barkley (PHI)', 'win'),
+    ('Jalen Hurts (PHI)', 'loss'),
+    ('Saquon Barkley (DAL)', 'loss'),
+])
+def test_settles_touchdown_picks(touchdowns, value, outcome):
+    add_pick(touchdowns, 'Touchdown Scorer', value)
+    add_score(touchdowns, 27, 20)
+    
+    assert [row['outcome'] for row in settle_touchdown_picks(2025, [1])] == [outcome]
+
+
+def test_near_miss_spelling_is_remembered_for_the_season(touchdowns):
+    add_pick(touchdowns, 'Touchdown Scorer', 'Saquan Barkley (PHI)')
+    add_score(touchdowns, 27, 20)
+    settle_touchdown_picks(2025, [1])
+    
+    assert touchdown_name_cache == {2025: {('PHI', 'saquan barkley'): 'saquon barkley'}}
+
+
+def test_touchdown_pick_is_left_out_until_scorers_are_loaded(touchdowns):
+    add_pick(touchdowns, 'Touchdown Scorer', 'Saquon Barkley (PHI)')
+    add_score(touchdowns, 27, 20, touchdowns_loaded=False)
+    
+    assert settle_touchdown_picks(2025, [1]) == []
+
+
+def test_final_game_missing_a_score_has_no_moneyline_winner(client, game):
+    add_score(game, 20, None)
+    db.session.commit()
+    
+    response = client.get('/api/game-results/1')
+    
+    assert response.status_code == 200
+    [result] = response.get_json()
+    assert (result['final'], result['moneyline_winner']) == (True, None)
@@ -0,0 +1,52 @@
+import pytest
+
+from app import db, import_history, Pick, Result, Standing
+
+RECORDS = [
+    {'season': 2025, 'week': 1, 'player': 'JB', 'category': 'Moneyline', 'value': 'Dallas Cowboys', 'outcome': 'win'},
+    {'season': 2025, 'week': 1, 'player': 'JB', 'category': 'Over', 'value': 'Eagles @ Cowboys 47', 'outcome': None},
+    {'season': 2025, 'week': 1, 'player': 'Rory', 'category': 'Underdog', 'value': None, 'outcome': 'loss'},
+    {'season': 2025, 'week': 2, 'player': 'Zach', 'category': 'Favorite', 'value': 'Buffalo Bills', 'outcome': 'tie'},
+]
+
+
+def export(runner, output_format, path):
+    result = runner.invoke(args=['export-history', '--format', output_format, str(path)])
+    assert result.exit_code == 0, result.output
+    return path.read_text()
+
+
+@pytest.mark.parametrize('output_format, malformed', [
+    ('ndjson', [
+        '{"season": 2025, "week": 3, "player": "JB", "category": "Over", "value": 45}',
+        '{"season": 2025, "week": 3, "player": 7, "category": "Moneyline", "value": "Buffalo Bills"}',
+    ]),
+    ('csv', ['2025,abc,JB,Moneyline,Buffalo Bills,win']),
+])
+def test_export_import_round_trip(app, tmp_path, output_format, malformed):
+    runner = app.test_cli_runner()
+    assert import_history(RECORDS) == {'picks': 3, 'results': 3}
+    path = tmp_path / f'history.{output_format}'
+    exported = export(runner, output_format, path)
+    
+    for model in (Standing, Result, Pick):
+        db.session.query(model).delete()
+    db.session.commit()
+    path.write_text(exported + '\n'.join(malformed) + '\n')
+    result = runner.invoke(args=['import-history', str(path)])
+    
+    assert result.exit_code == 0, result.output
+    assert result.output.endswith(f': 3 picks, 3 results, {len(malformed)} skipped\n')
+    assert export(runner, output_format, tmp_path / f'again.{output_format}') == exported
+
+
+def test_import_skips_records_with_non_string_fields(app):
+    records = [
+        {'season': 2025, 'week': 1, 'player': 'JB', 'category': 'Over', 'value': 45},
+        {'season': 2025, 'week': 1, 'player': 7, 'category': 'Moneyline', 'value': 'Dallas Cowboys'},
+        {'season': 2025, 'week': 1, 'player': 'JB', 'category': 'Moneyline', 'outcome': ['win']},
+        *RECORDS[:1],
+    ]
+    
+    assert import_history(records) == {'picks': 1, 'results': 1, 'skipped': 3}
+    assert [pick.value for pick in Pick.query] == ['Dallas Cowboys']
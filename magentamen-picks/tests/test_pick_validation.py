@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db, Game, OddsLine, Pick
+
+
+@pytest.fixture
+def game(app):
+    """A week 1 game kicking off tomorrow, with the Eagles favored by 6.5."""
+    kickoff = (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    game = Game(week=1, season=2025, home_team='Philadelphia Eagles', away_team='Dallas Cowboys', commence_time=kickoff)
+    db.session.add(game)
+    db.session.flush()
+    for team, point in (('Philadelphia Eagles', -6.5), ('Dallas Cowboys', 6.5)):
+        db.session.add(OddsLine(
+            game_id=game.id, bookmaker='fanduel', market='spreads', outcome=team,
+            price=-110, point=point, fetched_at=datetime.utcnow()
+        ))
+    db.session.commit()
+    return game
+
+
+def post_batch(client, picks, week=1):
+    return client.post('/api/picks/batch', json={'week': week, 'picks': picks})
+
+
+def test_batch_saves_valid_picks(client, game):
+    response = post_batch(client, {'JB': {'Favorite': 'Philadelphia Eagles', 'Underdog': 'Dallas Cowboys'}})
+    
+    assert response.status_code == 200
+    assert response.get_json()['saved'] == 2
+    assert {(pick.category, pick.line) for pick in Pick.query} == {('Favorite', -6.5), ('Underdog', 6.5)}
+
+
+@pytest.mark.parametrize('picks, error', [
+    ({'JB': {'Favorite': 'Dallas Cowboys'}}, 'JB: Dallas Cowboys is not favored'),
+    ({'JB': {'Underdog': 'Philadelphia Eagles'}}, 'JB: Philadelphia Eagles is not an underdog'),
+    ({'JB': {'Over': 45}}, 'JB: Over pick must be a string'),
+    ({' ': {'Moneyline': 'Dallas Cowboys'}}, 'Player name is required'),
+])
+def test_batch_rejects_invalid_picks(client, game, picks, error):
+    response = post_batch(client, picks)
+    
+    assert response.status_code == 400
+    assert response.get_json()['errors'] == [error]
+    assert Pick.query.count() == 0
+
+
+def test_batch_skips_checks_for_unchanged_picks(client, game):
+    post_batch(client, {'JB': {'Favorite': 'Philadelphia Eagles'}})
+    # The line flips after the pick was saved
+    for line in OddsLine.query.filter_by(game_id=game.id):
+        line.point = -line.point
+    db.session.commit()
+    
+    response = post_batch(client, {'JB': {'Favorite': 'Philadelphia Eagles', 'Moneyline': 'Dallas Cowboys'}})
+    
+    assert response.status_code == 200
+    assert response.get_json()['saved'] == 1
+    assert {(pick.category, pick.value) for pick in Pick.query} == {
+        ('Favorite', 'Philadelphia Eagles'), ('Moneyline', 'Dallas Cowboys')
+    }
+
+
+def test_batch_rejects_non_numeric_week(client, game):
+    response = post_batch(client, {'JB': {'Moneyline': 'Dallas Cowboys'}}, week='abc')
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Week must be a number'}
+
+
+@pytest.mark.parametrize('path, body', [
+    ('/api/picks', {'player': 'JB', 'category': 'Moneyline', 'value': 'Dallas Cowboys'}),
+    ('/api/results', {'player': 'JB', 'category': 'Moneyline', 'outcome': 'win'}),
+])
+def test_single_writes_reject_non_numeric_week(client, game, path, body):
+    response = client.post(path, json={'week': 'abc', **body})
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Week must be a number'}
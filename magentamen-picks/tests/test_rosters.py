@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from app import NFLPlayer, seed_rosters
+
+
+@pytest.fixture
+def roster_file(app, tmp_path, monkeypatch):
+    """Write rosters to a scratch ROSTER_FILE that the index rechecks on every request."""
+    path = tmp_path / 'starters.json'
+    monkeypatch.setitem(app.config, 'ROSTER_FILE', str(path))
+    monkeypatch.setitem(app.config, 'ROSTER_RELOAD_INTERVAL', 0)
+    
+    def write(rosters):
+        path.write_text(json.dumps(rosters))
+    return write
+
+
+def starters(client, teams):
+    return [(p['name'], p['team'], p['pos'], p['depth']) for p in client.get(f'/api/starters?teams={teams}').get_json()]
+
+
+def test_player_listed_for_two_teams_is_kept_under_both(client, roster_file, caplog):
+    roster_file({
+        'CHI': [{'name': 'Keenan Allen', 'pos': 'WR'}, {'name': 'DJ Moore', 'pos': 'WR'}],
+        'LAC': [{'name': 'Justin Herbert', 'pos': 'QB'}, {'name': 'Keenan Allen', 'pos': 'WR'}]
+    })
+    assert seed_rosters() == 4
+    
+    assert ('Keenan Allen', 'CHI', 'WR', 1) in starters(client, 'CHI')
+    assert ('Keenan Allen', 'LAC', 'WR', 1) in starters(client, 'LAC')
+    assert 'Keenan Allen is listed for CHI, LAC' in caplog.text
+
+
+def test_player_listed_twice_for_one_team_is_loaded_once(client, roster_file):
+    roster_file({'KC': [
+        {'name': 'Patrick Mahomes', 'pos': 'QB'},
+        {'name': 'Patrick Mahomes', 'pos': 'QB'},
+        {'name': 'Carson Wentz', 'pos': 'QB'}
+    ]})
+    assert seed_rosters() == 2
+    
+    assert starters(client, 'KC') == [('Patrick Mahomes', 'KC', 'QB', 1), ('Carson Wentz', 'KC', 'QB', 2)]
+
+
+def test_reseed_drops_players_no_longer_listed(client, roster_file):
+    roster_file({'BUF': [{'name': 'Josh Allen', 'pos': 'QB'}, {'name': 'Stefon Diggs', 'pos': 'WR'}]})
+    seed_rosters()
+    assert len(starters(client, 'BUF')) == 2
+    
+    roster_file({'BUF': [{'name': 'Josh Allen', 'pos': 'QB'}, {'name': 'Khalil Shakir', 'pos': 'WR'}]})
+    assert seed_rosters() == 2
+    
+    assert [name for name, *_ in starters(client, 'BUF')] == ['Josh Allen', 'Khalil Shakir']
+    assert [p['name'] for p in client.get('/api/starters/search?q=dig').get_json()] == []
+    assert not NFLPlayer.query.filter_by(name='Stefon Diggs').one().active
+
+
+@pytest.mark.parametrize('limit, count', [('0', 1), ('-5', 1), ('2', 2), ('500', 3)])
+def test_search_limit_is_clamped(client, roster_file, limit, count):
+    roster_file({'NYG': [
+        {'name': 'Saquon Barkley', 'pos': 'RB'},
+        {'name': 'Saquon Barkley Jr.', 'pos': 'RB'},
+        {'name': 'Saquon Barkly', 'pos': 'RB'}
+    ]})
+    seed_rosters()
+    
+    response = client.get(f'/api/starters/search?q=saquan&limit={limit}')
+    
+    assert response.status_code == 200
+    assert len(response.get_json()) == count
@@ -0,0 +1,45 @@
+import pytest
+
+from app import db, Player, Pick, Result
+
+
+def seed_week(week, players):
+    for i in range(players):
+        player = Player(name=f'Player {i}')
+        db.session.add(player)
+        db.session.flush()
+        for category in ('Moneyline', 'Over'):
+            pick = Pick(week=week, season=2025, player_id=player.id, category=category, value=f'Team {i}')
+            db.session.add(pick)
+            db.session.flush()
+            db.session.add(Result(
+                week=week, season=2025, player_id=player.id, category=category, outcome='win', pick_id=pick.id
+            ))
+    db.session.commit()
+
+
+@pytest.mark.parametrize('players', [4, 40])
+@pytest.mark.parametrize('path', ['/api/picks', '/api/results'])
+def test_week_reads_take_one_query(client, queries, path, players):
+    # A query per player or pick would grow with the league; this must stay flat
+    seed_week(1, players)
+    queries.clear()
+    
+    response = client.get(f'{path}?week=1')
+    
+    assert response.status_code == 200
+    assert len(response.get_json()) == players
+    assert len(queries) == 1, queries
+
+
+def test_results_include_the_pick(client):
+    seed_week(1, 1)
+    
+    response = client.get('/api/results?week=1')
+    
+    assert response.get_json() == {
+        'Player 0': {
+            'Moneyline': {'outcome': 'win', 'pick': 'Team 0'},
+            'Over': {'outcome': 'win', 'pick': 'Team 0'}
+        }
+    }